@@ -0,0 +1,140 @@
+"""
+    Emulator display throughput: a producer thread pushes frames as fast as it can
+    (as the scan preview does) while Tk runs its main loop, and we count how many
+    reach the window.
+
+        python benchmarks/bench_emulator_display.py
+
+    "Before" is the original desktopDisplay.ShowImage(), which built a new
+    PhotoImage and reconfigured the label from the producer's thread for every
+    frame. "After" is the current desktopDisplay: the producer only drops frames
+    into the mailbox and the Tk thread pastes the latest one into a persistent
+    image. Full frames and small partial updates are both timed.
+
+    Needs a display (e.g. run under xvfb-run).
+"""
+import threading
+import time
+import tkinter as tk
+
+import common
+from PIL import Image, ImageDraw, ImageTk
+from seedsigner.emulator.desktopDisplay import desktopDisplay
+from seedsigner.models.threads import ThreadsafeMailbox
+
+
+DURATION = 3.0
+NUM_FRAMES = 30
+REGION = (20, 100, 220, 140)
+
+
+
+class OldDisplay:
+    """ Before: a new PhotoImage and label update per frame, from the caller's thread """
+    def __init__(self, root: tk.Tk, label: tk.Label):
+        self.root = root
+        self.label = label
+        self.tkimage = None
+        self.frames_shown = 0
+
+    def ShowImage(self, Image2, Xstart, Ystart):
+        self.tkimage = ImageTk.PhotoImage(Image2, master=self.root)
+        self.label.configure(image=self.tkimage)
+        self.label.image = self.tkimage
+        self.label.place(x=125, y=10)
+        self.frames_shown += 1
+
+    def ShowImageRegion(self, Image2, Xstart, Ystart, Xend, Yend):
+        if self.tkimage is None:
+            self.ShowImage(Image2, 0, 0)
+            return
+        region = ImageTk.PhotoImage(Image2.crop((Xstart, Ystart, Xend, Yend)), master=self.root)
+        self.root.tk.call(str(self.tkimage), "copy", str(region), "-to", Xstart, Ystart)
+        self.frames_shown += 1
+
+
+
+def make_new_display(root: tk.Tk, label: tk.Label) -> desktopDisplay:
+    # desktopDisplay.run() also builds the emulator's buttons and needs the
+    # Controller; only its display half is set up here, the same way.
+    display = desktopDisplay.__new__(desktopDisplay)
+    display.width = display.height = 240
+    display.frames = ThreadsafeMailbox()
+    display.frames_shown = 0
+    display.poll_ms = desktopDisplay.FRAME_POLL_MS
+    display.root = root
+    display.tkimage = ImageTk.PhotoImage("RGB", (240, 240), master=root)
+    display.staging_tkimage = ImageTk.PhotoImage("RGB", (240, 240), master=root)
+    label.configure(image=display.tkimage)
+    root.after(0, display.blit_pending_frame)
+    return display
+
+
+
+def make_frames() -> list:
+    frames = []
+    for i in range(NUM_FRAMES):
+        frame = Image.new("RGB", (240, 240), (i * 8, 64, 255 - i * 8))
+        ImageDraw.Draw(frame).rectangle(REGION, fill=(255, i * 8, 0))
+        frames.append(frame)
+    return frames
+
+
+
+def run(make_display, partial: bool, frames: list) -> list:
+    root = tk.Tk()
+    label = tk.Label(root)
+    label.place(x=125, y=10)
+    display = make_display(root, label)
+    produced = 0
+    show_time = 0.0
+
+    def produce():
+        nonlocal produced, show_time
+        deadline = time.perf_counter() + DURATION
+        while time.perf_counter() < deadline:
+            frame = frames[produced % len(frames)]
+            start = time.perf_counter()
+            if partial:
+                display.ShowImageRegion(frame, *REGION)
+            else:
+                display.ShowImage(frame, 0, 0)
+            show_time += time.perf_counter() - start
+            produced += 1
+        root.after(100, root.quit)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    root.after(100, producer.start)
+    root.mainloop()
+    producer.join()
+    root.destroy()
+
+    return [
+        f"{produced / DURATION:.0f}",
+        common.format_us(show_time / produced),
+        f"{display.frames_shown / DURATION:.0f}",
+    ]
+
+
+
+def main():
+    try:
+        tk.Tk().destroy()
+    except tk.TclError as e:
+        print(f"No display to run Tk on ({e}); try xvfb-run")
+        return
+
+    frames = make_frames()
+    rows = []
+    for partial in [False, True]:
+        kind = "region" if partial else "full frame"
+        rows.append([f"before, {kind}"] + run(OldDisplay, partial, frames))
+        rows.append([f"after, {kind}"] + run(make_new_display, partial, frames))
+
+    print(f"{DURATION:g} s per run")
+    common.print_table(["", "produced/s", "per ShowImage", "displayed/s"], rows)
+
+
+
+if __name__ == "__main__":
+    main()
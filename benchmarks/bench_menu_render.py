@@ -0,0 +1,94 @@
+"""
+    Menu navigation render time: entering a few menus and scrolling the selection
+    through each one, with and without the `RenderedImageCache` of TextArea/Button
+    bitmaps.
+
+        python benchmarks/bench_menu_render.py
+
+    "Before" runs the same code with `RenderedImageCache.max_bytes = 0`, so nothing
+    is cached (the cache lookups themselves are still made, which slightly flatters
+    the old code path). Both runs must draw identical frames.
+"""
+import hashlib
+
+import common
+from PIL import Image, ImageDraw
+from seedsigner.gui import components
+from seedsigner.gui.components import GUIConstants, RenderedImageCache, SeedSignerIconConstants
+from seedsigner.gui.renderer import Renderer
+
+
+MENUS = [
+    ("Settings", ["Language", "Persistent settings", "Coordinators", "Denomination display", "Advanced"]),
+    ("Tools", ["New seed", "Calc 12th/24th word", "Address explorer", "Verify address"]),
+    ("Home", ["Scan", "Seeds", "Tools", "Settings"]),
+]
+
+
+
+def make_renderer() -> Renderer:
+    # A bare canvas; the components only need the singleton's canvas and draw
+    renderer = Renderer.__new__(Renderer)
+    renderer.canvas_width = renderer.canvas_height = 240
+    renderer.canvas = Image.new("RGB", (240, 240))
+    renderer.draw = ImageDraw.Draw(renderer.canvas)
+    Renderer._instance = renderer
+    return renderer
+
+
+
+def render_menu(renderer: Renderer, title: str, labels: list, selected: int):
+    renderer.draw.rectangle((0, 0, 240, 240), fill=0)
+    frame_components = [components.TopNav(text=title, is_selected=(selected < 0))]
+    screen_y = GUIConstants.TOP_NAV_HEIGHT
+    for (i, label) in enumerate(labels):
+        frame_components.append(components.Button(text=label, screen_y=screen_y, is_selected=(i == selected), right_icon_name=SeedSignerIconConstants.CHEVRON_RIGHT))
+        screen_y += GUIConstants.BUTTON_HEIGHT + GUIConstants.LIST_ITEM_PADDING
+    frame_components.append(components.TextArea(text=f"Body text for the {title} menu screen", screen_y=200, height=40))
+    for component in frame_components:
+        component.render()
+
+
+
+def navigate(renderer: Renderer) -> str:
+    """ Enters each menu and scrolls through it; returns a digest of every frame """
+    digest = hashlib.sha1()
+    for (title, labels) in MENUS:
+        for selected in range(-1, len(labels)):
+            render_menu(renderer, title, labels, selected)
+            digest.update(renderer.canvas.tobytes())
+    return digest.hexdigest()
+
+
+
+def main():
+    renderer = make_renderer()
+    num_frames = sum(len(labels) + 1 for (_, labels) in MENUS)
+    max_bytes = RenderedImageCache.max_bytes
+
+    RenderedImageCache.max_bytes = 0
+    RenderedImageCache.clear()
+    before_digest = navigate(renderer)
+    before = common.time_per_call(lambda: navigate(renderer), number=10) / num_frames
+
+    RenderedImageCache.max_bytes = max_bytes
+    RenderedImageCache.clear()
+    RenderedImageCache.hits = RenderedImageCache.misses = 0
+    after_digest = navigate(renderer)
+    (cold_hits, cold_misses) = (RenderedImageCache.hits, RenderedImageCache.misses)
+    after = common.time_per_call(lambda: navigate(renderer), number=10) / num_frames
+
+    assert before_digest == after_digest, "cached frames differ from uncached ones"
+
+    print(f"per frame, {num_frames} frames per pass")
+    common.print_table(
+        ["", "before", "after", "speedup"],
+        [["menu frame", common.format_ms(before), common.format_ms(after), f"{before / after:.1f}x"]],
+    )
+    print()
+    print(f"cache: {len(RenderedImageCache.images)} images, {RenderedImageCache.num_bytes // 1024} KiB; first pass {cold_hits} hits / {cold_misses} misses")
+
+
+
+if __name__ == "__main__":
+    main()
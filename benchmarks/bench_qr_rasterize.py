@@ -0,0 +1,74 @@
+"""
+    Animated QR frame rasterization: the original `QR.qrimage_io`, which shelled
+    out to `qrencode` and round-tripped a PNG through /tmp, vs the in-process
+    rasterizer, and vs re-coloring a cached module image as `QRDisplayScreen` does
+    for repeated parts. Reports frames per second for UR parts at each QR density.
+
+        python benchmarks/bench_qr_rasterize.py
+
+    Without a `qrencode` binary the original code fell back to `QR.qrimage()`
+    after the failed shell call; that is what "before" measures in that case.
+"""
+import os
+import shutil
+import subprocess
+import tempfile
+
+import common
+from PIL import Image
+from seedsigner.helpers.qr import QR
+from seedsigner.helpers.ur2.bytewords import Bytewords, Bytewords_Style_minimal
+
+
+# Fragment sizes for SettingsConstants.DENSITY__LOW/MEDIUM/HIGH fountain QRs
+FRAGMENT_SIZES = [10, 30, 120]
+
+
+
+def old_qrimage_io(qr, path, data, width=240, height=240, border=3, background_color="808080"):
+    # Before: QR.qrimage_io, writing to `path` instead of a fixed /tmp/qrcode.png
+    if 1 <= border <= 10:
+        border_str = str(border)
+    else:
+        border_str = "3"
+
+    cmd = f"""qrencode -m {border_str} -s 3 -l L --foreground=000000 --background={background_color} -t PNG -o "{path}" "{str(data)}" """
+    rv = subprocess.call(cmd, shell=True, stderr=subprocess.DEVNULL)
+
+    # if qrencode fails, fall back to only encoder
+    if rv != 0:
+        return qr.qrimage(data, width, height, border)
+    return Image.open(path).resize((width, height), Image.NEAREST).convert("RGBA")
+
+
+
+def main():
+    qr = QR()
+    has_qrencode = shutil.which("qrencode") is not None
+    print(f"before: {'qrencode subprocess' if has_qrencode else 'failed shell call + QR.qrimage() fallback (no qrencode)'}")
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "qrcode.png")
+        for size in FRAGMENT_SIZES:
+            part = "UR:CRYPTO-PSBT/37-12/" + Bytewords.encode(Bytewords_Style_minimal, os.urandom(size + 12)).upper()
+            modules = qr.qrimage_palette(part, border=2)
+
+            before = common.time_per_call(lambda: old_qrimage_io(qr, path, part, border=2), number=10, repeat=3)
+            after = common.time_per_call(lambda: qr.qrimage_io(part, border=2))
+            cached = common.time_per_call(lambda: QR.palette_to_image(modules, 240, 240, background_color="808080"))
+            rows.append([
+                size,
+                f"{modules.width}x{modules.height}",
+                f"{1 / before:.0f} fps",
+                f"{1 / after:.0f} fps",
+                f"{before / after:.1f}x",
+                f"{1 / cached:.0f} fps",
+            ])
+
+    common.print_table(["fragment", "modules", "before", "in-process", "speedup", "cached part"], rows)
+
+
+
+if __name__ == "__main__":
+    main()
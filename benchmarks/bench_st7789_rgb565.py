@@ -0,0 +1,97 @@
+"""
+    ST7789 frame conversion: RGB image -> RGB-5:6:5 bytes for the SPI write, for a
+    full frame and a partial-update region.
+
+        python benchmarks/bench_st7789_rgb565.py
+
+    "Before" is the original convert("BGR;16") + array.byteswap() path; Pillow 12
+    removed that mode, so it's only timed on older Pillow. "numpy" and "Pillow" are
+    the two paths of ST7789.to_rgb565() (the latter, again, only on Pillow < 12).
+    Each is followed by a copy of the result standing in for spidev.writebytes2();
+    the actual transfer at 40 MHz is listed for scale.
+
+    Runs without the hardware: the RPi.GPIO and spidev modules are stubbed here and
+    the display is never initialized.
+"""
+import array
+import random
+import sys
+import types
+import warnings
+
+import common
+import numpy as np
+import PIL
+from PIL import Image
+
+for module_name in ["RPi", "RPi.GPIO", "spidev"]:
+    sys.modules.setdefault(module_name, types.ModuleType(module_name))
+sys.modules["RPi"].GPIO = sys.modules["RPi.GPIO"]
+warnings.filterwarnings("ignore", "BGR;16", DeprecationWarning)
+
+from seedsigner.hardware.ST7789 import ST7789
+
+
+SPI_HZ = 40_000_000
+
+
+
+def before(image: Image.Image) -> bytes:
+    arr = array.array("H", image.convert("BGR;16").tobytes())
+    arr.byteswap()
+    return arr.tobytes()
+
+
+
+def reference(image: Image.Image) -> bytes:
+    rgb = np.frombuffer(image.tobytes(), dtype=np.uint8).reshape(-1, 3).astype(np.uint16)
+    return (((rgb[:, 0] & 0xF8) << 8) | ((rgb[:, 1] & 0xFC) << 3) | (rgb[:, 2] >> 3)).astype(">u2").tobytes()
+
+
+
+def make_display(use_pillow_bgr16: bool) -> ST7789:
+    display = ST7789.__new__(ST7789)
+    display.width = display.height = 240
+    display._framebuffer = np.empty(240 * 240, dtype="<u2")
+    display._accum = np.empty(240 * 240, dtype="<u4")
+    display._scratch = np.empty(240 * 240, dtype="<u4")
+    display.USE_PILLOW_BGR16 = use_pillow_bgr16
+    return display
+
+
+
+def main():
+    random.seed(0)
+    frame = Image.frombytes("RGB", (240, 240), random.randbytes(240 * 240 * 3))
+    images = [("full frame", frame), ("region 187x37", frame.crop((13, 40, 200, 77)))]
+
+    cases = []
+    if ST7789.USE_PILLOW_BGR16:
+        cases.append(("before", before))
+    cases.append(("numpy", make_display(use_pillow_bgr16=False).to_rgb565))
+    if ST7789.USE_PILLOW_BGR16:
+        cases.append(("Pillow", make_display(use_pillow_bgr16=True).to_rgb565))
+
+    sink = bytearray(240 * 240 * 2)
+    rows = []
+    for (name, image) in images:
+        expected = reference(image)
+        row = [name]
+        for (_, convert) in cases:
+            assert bytes(convert(image)) == expected, "wrong RGB565 output"
+
+            def convert_and_send():
+                pixels = memoryview(convert(image)).cast("B")
+                sink[:len(pixels)] = pixels
+
+            row.append(common.format_ms(common.time_per_call(convert_and_send)))
+        row.append(common.format_ms(len(expected) * 8 / SPI_HZ))
+        rows.append(row)
+
+    print(f"Pillow {PIL.__version__}, numpy {np.__version__}")
+    common.print_table([""] + [name for (name, _) in cases] + ["SPI @ 40 MHz"], rows)
+
+
+
+if __name__ == "__main__":
+    main()
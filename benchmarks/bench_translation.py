@@ -0,0 +1,149 @@
+"""
+    Translation lookups for a KR/JP session: the original `LanguageTranslation`,
+    which re-read and json-parsed the language file on every `translator()` call,
+    vs the shared, catalog-backed registry. Times single lookups and building and
+    rendering a few screens the way their Views do.
+
+        python benchmarks/bench_translation.py
+
+    The screen part needs the full app dependencies (embit etc.) and is skipped
+    without them; it falls back to the EN fonts if the CJK ones aren't installed.
+"""
+import json
+import os
+
+import common
+from seedsigner.models import language_catalog
+from seedsigner.models.language_translation import LanguageTranslation
+
+
+LANGUAGES = ["KR", "JP"]
+FONT_LANGUAGES = ["KR", "SC", "JP"]
+KEYS = ["Home", "Scan", "Seeds", "Tools", "Settings", "Back", "Enabled", "Disabled"]
+
+
+
+class OldLanguageTranslation:
+    """ Before: a new instance (and json.load) per translator() call """
+    def __init__(self, language_code):
+        self.language_code = language_code
+        self.translations = self.load_translations()
+
+    @classmethod
+    def get_instance(cls, language_code):
+        return cls(language_code)
+
+    def load_translations(self):
+        file_path = os.path.join(language_catalog.LANGUAGE_DIR, f'{self.language_code}.json')
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def translate(self, text, **kwargs):
+        translated = self.translations.get(text, text)
+        if kwargs:
+            try:
+                translated = translated.format(**kwargs)
+            except KeyError:
+                return text.format(**kwargs)
+        return translated
+
+
+
+def time_lookups():
+    rows = []
+    for language_code in LANGUAGES:
+        def before():
+            for key in KEYS:
+                OldLanguageTranslation.get_instance(language_code).translate(key)
+
+        def after():
+            for key in KEYS:
+                LanguageTranslation.get_instance(language_code).translate(key)
+
+        # First use of a language (includes building its catalog if needed)
+        LanguageTranslation.clear_cache()
+        first = common.time_per_call(lambda: (LanguageTranslation.clear_cache(), after()), number=1, repeat=1)
+
+        before_time = common.time_per_call(before) / len(KEYS)
+        after_time = common.time_per_call(after) / len(KEYS)
+        rows.append([language_code, common.format_us(before_time), common.format_us(after_time), f"{before_time / after_time:.0f}x", common.format_ms(first)])
+
+    print("translator() lookup")
+    common.print_table(["", "before", "after", "speedup", "first use"], rows)
+
+
+
+def time_screens():
+    try:
+        from seedsigner.gui import components
+        from seedsigner.gui.components import Fonts, GUIConstants, SeedSignerIconConstants
+        from seedsigner.gui.renderer import Renderer
+        from seedsigner.gui.screens import screen
+        from seedsigner.views import view
+    except ImportError as e:
+        print(f"screen construction: skipped ({e})")
+        return
+
+    Renderer.configure_instance(display=Renderer.DISPLAY__HEADLESS)
+    Renderer.get_instance().flush_thread.stop()
+    Renderer.get_instance().flush_thread = None
+
+    def build_screens():
+        translator = view.translator
+        button_data = [
+            (translator("Scan"), SeedSignerIconConstants.SCAN),
+            (translator("Seeds"), SeedSignerIconConstants.SEEDS),
+            (translator("Tools"), SeedSignerIconConstants.TOOLS),
+            (translator("Settings"), SeedSignerIconConstants.SETTINGS),
+        ]
+        screens = [
+            screen.MainMenuScreen(title=translator("Home"), button_data=button_data),
+            screen.ButtonListScreen(title=translator("Settings"), button_data=[translator(key) for key in ["Language", "Advanced", "Enabled", "Disabled"]]),
+            screen.WarningScreen(
+                status_headline=translator("Full Spend!"),
+                text=translator("This PSBT spends its entire input value. No change is coming back to your wallet."),
+                button_data=[translator("Continue")],
+            ),
+            screen.PowerOffScreen(),
+        ]
+        for cur_screen in screens:
+            cur_screen._render()
+
+    rows = []
+    for language_code in LANGUAGES:
+        # As LanguageSelectionView sets them
+        view.view_current_selected_language = language_code
+        screen.screen_current_selected_language = language_code
+        components.components_current_selected_language = language_code
+        font_language = language_code if language_code in FONT_LANGUAGES else "EN"
+        if not os.path.exists(os.path.join(Fonts.font_path, f"NotoSans{font_language}-Regular.ttf")):
+            # The CJK fonts aren't bundled in every checkout; the lookups are what's timed
+            font_language = "EN"
+        GUIConstants.TOP_NAV_TITLE_FONT_NAME = f'NotoSans{font_language}-SemiBold'
+        GUIConstants.BODY_FONT_NAME = f'NotoSans{font_language}-SemiBold'
+        GUIConstants.BUTTON_FONT_NAME = f'NotoSans{font_language}-SemiBold'
+        GUIConstants.REGULAR_FONT_NAME = f'NotoSans{font_language}-Regular'
+
+        build_screens()
+        for module in (screen, view):
+            module.LanguageTranslation = OldLanguageTranslation
+        before = common.time_per_call(build_screens, number=5)
+        for module in (screen, view):
+            module.LanguageTranslation = LanguageTranslation
+        after = common.time_per_call(build_screens, number=5)
+        rows.append([language_code, common.format_ms(before), common.format_ms(after), f"{before / after:.1f}x"])
+
+    print("build + render Home, a settings list, a warning and the power-off screen")
+    common.print_table(["", "before", "after", "speedup"], rows)
+
+
+
+def main():
+    time_lookups()
+    print()
+    time_screens()
+
+
+
+if __name__ == "__main__":
+    main()
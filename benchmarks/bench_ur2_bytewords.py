@@ -0,0 +1,96 @@
+"""
+    Bytewords codec throughput on 120-byte fragments: the original per-word codec
+    vs the table-driven one in `helpers/ur2/bytewords.py`.
+
+        python benchmarks/bench_ur2_bytewords.py
+"""
+import os
+
+import common
+from seedsigner.helpers.ur2.bytewords import (Bytewords, Bytewords_Style_minimal,
+    Bytewords_Style_standard, BYTEWORDS, get_minimal_word, get_word)
+from seedsigner.helpers.ur2.utils import crc32_bytes
+
+
+FRAGMENT_LEN = 120
+
+
+
+# Before: the per-word codec
+WORD_ARRAY = [-1] * (26 * 26)
+for i in range(256):
+    WORD_ARRAY[(ord(BYTEWORDS[i * 4 + 3]) - ord('a')) * 26 + ord(BYTEWORDS[i * 4]) - ord('a')] = i
+
+def old_decode_word(word, word_len):
+    if len(word) != word_len:
+        raise ValueError('Invalid Bytewords.')
+    dim = 26
+    x = ord(word[0].lower()) - ord('a')
+    y = ord((word[3 if len(word) == 4 else 1]).lower()) - ord('a')
+    if not (0 <= x and x < dim and 0 <= y and y < dim):
+        raise ValueError('Invalid Bytewords.')
+    value = WORD_ARRAY[y * dim + x]
+    if value == -1:
+        raise ValueError('Invalid Bytewords.')
+    if len(word) == 4:
+        byteword_offset = value * 4
+        if word[1].lower() != BYTEWORDS[byteword_offset + 1] or word[2].lower() != BYTEWORDS[byteword_offset + 2]:
+            raise ValueError('Invalid Bytewords.')
+    return value
+
+def old_encode(buf, separator):
+    words = []
+    for i in range(len(buf)):
+        words.append(get_word(buf[i]))
+    return separator.join(words + [get_word(b) for b in crc32_bytes(buf)])
+
+def old_encode_minimal(buf):
+    result = ''
+    crc_buf = buf + crc32_bytes(buf)
+    for i in range(len(crc_buf)):
+        result += get_minimal_word(crc_buf[i])
+    return result
+
+def old_decode(s, separator, word_len):
+    buf = bytearray()
+    if word_len == 4:
+        words = s.split(separator)
+    else:
+        words = [s[i:i+2] for i in range(0, len(s), 2)]
+    for word in words:
+        buf.append(old_decode_word(word, word_len))
+    if len(buf) < 5:
+        raise ValueError('Invalid Bytewords.')
+    body = buf[0:-4]
+    checksum = crc32_bytes(body)  # computed but never checked
+    return body
+
+
+
+def main():
+    data = bytearray(os.urandom(FRAGMENT_LEN))
+    minimal = Bytewords.encode(Bytewords_Style_minimal, data)
+    standard = Bytewords.encode(Bytewords_Style_standard, data)
+    assert old_encode_minimal(data) == minimal
+    assert old_encode(data, ' ') == standard
+    assert old_decode(minimal, 0, 2) == Bytewords.decode(Bytewords_Style_minimal, minimal) == data
+
+    cases = [
+        ("decode minimal", lambda: old_decode(minimal, 0, 2), lambda: Bytewords.decode(Bytewords_Style_minimal, minimal)),
+        ("decode standard", lambda: old_decode(standard, ' ', 4), lambda: Bytewords.decode(Bytewords_Style_standard, standard)),
+        ("encode minimal", lambda: old_encode_minimal(data), lambda: Bytewords.encode(Bytewords_Style_minimal, data)),
+        ("encode standard", lambda: old_encode(data, ' '), lambda: Bytewords.encode(Bytewords_Style_standard, data)),
+    ]
+    rows = []
+    for (name, before_fn, after_fn) in cases:
+        before = common.time_per_call(before_fn)
+        after = common.time_per_call(after_fn)
+        rows.append([name, common.format_us(before), common.format_us(after), f"{before / after:.1f}x"])
+
+    print(f"{FRAGMENT_LEN}-byte fragment")
+    common.print_table(["", "before", "after", "speedup"], rows)
+
+
+
+if __name__ == "__main__":
+    main()
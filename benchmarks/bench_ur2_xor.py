@@ -0,0 +1,66 @@
+"""
+    Fragment XOR in the ur2 fountain codec: the original byte-by-byte loop vs
+    `xor_bytes()` (whole fragments as ints) and the in-place `xor_into()`, for the
+    fragment sizes that animated QRs use, plus `FountainEncoder.mix()` of a
+    degree-3 part.
+
+        python benchmarks/bench_ur2_xor.py
+"""
+import os
+
+import common
+from seedsigner.helpers.ur2.fountain_encoder import FountainEncoder
+from seedsigner.helpers.ur2.utils import xor_bytes, xor_into
+
+
+FRAGMENT_SIZES = [10, 30, 60, 120, 250, 500]
+
+
+
+def loop_xor_into(target, source):
+    # Before: utils.xor_into
+    count = len(target)
+    assert count == len(source) # Must be the same length
+    for i in range(count):
+        target[i] ^= source[i]
+
+
+
+def loop_mix(encoder, indexes):
+    # Before: FountainEncoder.mix
+    result = [0] * encoder.fragment_len
+    for index in indexes:
+        loop_xor_into(result, encoder.fragments[index])
+    return result
+
+
+
+def main():
+    rows = []
+    for size in FRAGMENT_SIZES:
+        a = os.urandom(size)
+        b = os.urandom(size)
+        target = bytearray(a)
+        before = common.time_per_call(lambda: loop_xor_into(bytearray(a), b))
+        after = common.time_per_call(lambda: xor_bytes(a, b))
+        in_place = common.time_per_call(lambda: xor_into(target, b))
+        rows.append([size, common.format_us(before), common.format_us(after), f"{before / after:.1f}x", common.format_us(in_place)])
+    print("xor of two fragments")
+    common.print_table(["bytes", "before (loop)", "xor_bytes", "speedup", "xor_into"], rows)
+
+    print()
+    rows = []
+    for size in FRAGMENT_SIZES:
+        encoder = FountainEncoder(os.urandom(size * 20), max_fragment_len=size)
+        indexes = [0, 7, 13]
+        assert bytes(loop_mix(encoder, indexes)) == encoder.mix(indexes)
+        before = common.time_per_call(lambda: loop_mix(encoder, indexes))
+        after = common.time_per_call(lambda: encoder.mix(indexes))
+        rows.append([encoder.fragment_len, common.format_us(before), common.format_us(after), f"{before / after:.1f}x"])
+    print("FountainEncoder.mix() of 3 fragments")
+    common.print_table(["bytes", "before", "after", "speedup"], rows)
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+    Shared helpers for the scripts in this directory. Each script is run directly
+    from the repo root, e.g.:
+
+        python benchmarks/bench_ur2_xor.py
+
+    and prints a before/after table. "Before" is the implementation the change
+    replaced, kept inline in the script so the comparison needs no old checkout.
+"""
+import os
+import sys
+import timeit
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+
+
+def time_per_call(fn, number: int = None, repeat: int = 5) -> float:
+    """ Best-of-`repeat` seconds per call of `fn()`; `number` is picked if None """
+    timer = timeit.Timer(fn)
+    if number is None:
+        (number, _) = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+
+def print_table(header: list, rows: list):
+    widths = [max(len(str(row[i])) for row in [header] + rows) for i in range(len(header))]
+    for row in [header] + rows:
+        print("  ".join(str(cell).rjust(width) for (cell, width) in zip(row, widths)))
+
+
+
+def format_us(seconds: float) -> str:
+    return f"{seconds * 1e6:.1f} us"
+
+
+
+def format_ms(seconds: float) -> str:
+    return f"{seconds * 1e3:.2f} ms"
@@ -5,6 +5,7 @@ import logging
 import sys
 
 from seedsigner.controller import Controller
+from seedsigner.gui.renderer import Renderer
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +30,28 @@ def main(sys_argv=None):
         ),
     )
 
+    parser.add_argument(
+        "--display",
+        choices=Renderer.ALL_DISPLAYS,
+        default=Renderer.DISPLAY__DESKTOP,
+        type=str,
+        help="Display backend (default: %(default)s); 'headless' runs without a window",
+    )
+    parser.add_argument(
+        "--record-frames",
+        metavar="DIR",
+        default=None,
+        type=str,
+        help="Headless display only: dump every displayed frame (plus a frames.csv index) to DIR",
+    )
+    parser.add_argument(
+        "--record-format",
+        choices=["png", "raw"],
+        default="png",
+        type=str,
+        help="Format for --record-frames (default: %(default)s)",
+    )
+
     args = parser.parse_args(sys_argv)
 
     root_logger = logging.getLogger()
@@ -45,7 +68,14 @@ def main(sys_argv=None):
 
     logger.info(f"Starting SeedSigner with: {args.__dict__}")
 
-    # Get the one and only Controller instance and start our main loop
+    display_kwargs = {}
+    if args.record_frames:
+        if args.display != Renderer.DISPLAY__HEADLESS:
+            parser.error("--record-frames requires --display headless")
+        display_kwargs = dict(record_dir=args.record_frames, record_format=args.record_format)
+
+    # Configure the one and only Controller instance and start our main loop
+    Controller.configure_instance(display=args.display, display_kwargs=display_kwargs)
     Controller.get_instance().start()
 
 
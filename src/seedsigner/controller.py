@@ -151,7 +151,7 @@ class Controller(Singleton):
 
 
     @classmethod
-    def configure_instance(cls, disable_hardware=False):
+    def configure_instance(cls, disable_hardware=False, display: str = None, display_kwargs: dict = None):
         """
             - `disable_hardware` is only meant to be used by the test suite so that it
             can keep re-initializing a Controller in however many tests it needs to. But
@@ -161,6 +161,9 @@ class Controller(Singleton):
             RuntimeError: Conflicting edge detection already enabled for this GPIO channel
 
             each time you try to re-initialize a Controller.
+
+            - `display` / `display_kwargs` are passed through to
+            `Renderer.configure_instance()` (e.g. to run headless).
         """
         from seedsigner.gui.renderer import Renderer
         from seedsigner.hardware.microsd import MicroSD
@@ -184,7 +187,10 @@ class Controller(Singleton):
         controller.psbt_parser = None
 
         # Configure the Renderer
-        Renderer.configure_instance()
+        if display:
+            Renderer.configure_instance(display=display, **(display_kwargs or {}))
+        else:
+            Renderer.configure_instance()
 
         controller.back_stack = BackStack()
 
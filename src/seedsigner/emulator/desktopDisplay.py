@@ -5,10 +5,9 @@
 
 
 
-import time
-
 from seedsigner.emulator.virtualGPIO import GPIO
 from seedsigner.hardware.buttons import HardwareButtons
+from seedsigner.models.threads import ThreadsafeMailbox
 
 from tkinter import *
 import tkinter as tk
@@ -25,10 +24,25 @@ EMULATOR_VERSION = '0.5'
 class desktopDisplay(threading.Thread):
     """class for desktop display."""
     root=0
+    tkimage=None
+
+    # The Tk thread polls for a new frame every FRAME_POLL_MS while frames keep
+    # coming, backing off to IDLE_POLL_MS when there are none.
+    FRAME_POLL_MS = 10
+    IDLE_POLL_MS = 50
+
     def __init__(self):
         self.width = 240
         self.height = 240
 
+        # Frames are handed to the Tk thread through a latest-wins mailbox: only the
+        # latest frame (and the union of the regions changed since the last blit)
+        # is kept. Only the Tk thread touches Tk objects, so it polls the mailbox
+        # from its own event loop.
+        self.frames = ThreadsafeMailbox()
+        self.frames_shown = 0
+        self.poll_ms = self.FRAME_POLL_MS
+
         # Multithreading
         threading.Thread.__init__(self)
         self.start()
@@ -62,8 +76,14 @@ class desktopDisplay(threading.Thread):
         # ....
 
 
-        self.label=Label(self.root)
+        # One persistent PhotoImage that every frame is pasted into. Partial updates
+        # are pasted into an offscreen one first, and only the changed region is
+        # copied across.
+        self.tkimage = ImageTk.PhotoImage("RGB", (self.width, self.height), master=self.root)
+        self.staging_tkimage = ImageTk.PhotoImage("RGB", (self.width, self.height), master=self.root)
+        self.label=Label(self.root, image=self.tkimage)
         self.label.pack()
+        self.label.place(x=125, y=10)
 
         self.joystick=Frame(self.root)
         self.joystick.pack()
@@ -106,22 +126,29 @@ class desktopDisplay(threading.Thread):
         self.bindButtonClick(self.btn3)
 
         
-        def key_handler(event):
-            
-            if(event.keysym=="Up"): GPIO.set_input(HardwareButtons.KEY_UP_PIN, GPIO.HIGH)
-            if(event.keysym=="Down"): GPIO.set_input(HardwareButtons.KEY_DOWN_PIN, GPIO.HIGH)
-            if(event.keysym=="Left"): GPIO.set_input(HardwareButtons.KEY_LEFT_PIN, GPIO.HIGH)
-            if(event.keysym=="Right"): GPIO.set_input(HardwareButtons.KEY_RIGHT_PIN, GPIO.HIGH)
+        keysym_pins = {
+            "Up": HardwareButtons.KEY_UP_PIN,
+            "Down": HardwareButtons.KEY_DOWN_PIN,
+            "Left": HardwareButtons.KEY_LEFT_PIN,
+            "Right": HardwareButtons.KEY_RIGHT_PIN,
+            "1": HardwareButtons.KEY1_PIN, "KP_1": HardwareButtons.KEY1_PIN,
+            "2": HardwareButtons.KEY2_PIN, "KP_2": HardwareButtons.KEY2_PIN,
+            "3": HardwareButtons.KEY3_PIN, "KP_3": HardwareButtons.KEY3_PIN,
+            "Return": HardwareButtons.KEY_PRESS_PIN,
+        }
 
-            if(event.keysym in ("1", "KP_1") ): GPIO.set_input(HardwareButtons.KEY1_PIN, GPIO.HIGH)
-            if(event.keysym in ("2", "KP_2") ): GPIO.set_input(HardwareButtons.KEY2_PIN, GPIO.HIGH)
-            if(event.keysym in ("3", "KP_3") ): GPIO.set_input(HardwareButtons.KEY3_PIN, GPIO.HIGH)
+        def key_handler(event):
+            if event.keysym in keysym_pins: GPIO.set_input(keysym_pins[event.keysym], GPIO.HIGH)
 
-            if(event.keysym=="Return"): GPIO.set_input(HardwareButtons.KEY_PRESS_PIN, GPIO.HIGH)
+        def key_release_handler(event):
+            if event.keysym in keysym_pins: GPIO.set_input(keysym_pins[event.keysym], GPIO.LOW)
 
         self.root.bind("<Key>", key_handler)
+        self.root.bind("<KeyRelease>", key_release_handler)
 
         self.root.resizable(width = True, height = True)
+
+        self.root.after(0, self.blit_pending_frame)
         self.root.mainloop()
      
  
@@ -141,18 +168,52 @@ class desktopDisplay(threading.Thread):
         GPIO.fire_raise_event(pin)
 
     def ShowImage(self,Image2,Xstart,Ystart):
-        while(self.root==0): time.sleep(0.1)
         imwidth, imheight = Image2.size
         if imwidth != self.width or imheight != self.height:
             raise ValueError('Image must be same dimensions as display \
                 ({0}x{1}).' .format(self.width, self.height))
 
-        self.tkimage= ImageTk.PhotoImage(Image2, master=self.root)
-        self.label.configure(image=self.tkimage)
-        self.label.image=self.tkimage
-        self.label.place(x=125, y=10)
-       
-        
+        self.queue_frame(Image2, (0, 0, self.width, self.height))
+
+    def ShowImageRegion(self,Image2,Xstart,Ystart,Xend,Yend):
+        self.queue_frame(Image2, (Xstart, Ystart, Xend, Yend))
+
+    def queue_frame(self, Image2, rect):
+        """ Safe to call from any thread; `Image2` must be a full-screen frame """
+        self.frames.put((Image2, rect), merge=self.merge_frames)
+
+    @staticmethod
+    def merge_frames(pending, latest):
+        # The pending frame wasn't blitted yet; the newer frame supersedes it but its
+        # changed region still has to be repainted.
+        (_, pending_rect) = pending
+        (frame, rect) = latest
+        return (frame, (
+            min(rect[0], pending_rect[0]),
+            min(rect[1], pending_rect[1]),
+            max(rect[2], pending_rect[2]),
+            max(rect[3], pending_rect[3]),
+        ))
+
+    def blit_pending_frame(self):
+        """ Runs on the Tk thread and reschedules itself """
+        pending = self.frames.take(timeout=0)
+        if pending is None:
+            self.poll_ms = min(self.poll_ms * 2, self.IDLE_POLL_MS)
+        else:
+            self.poll_ms = self.FRAME_POLL_MS
+            (frame, rect) = pending
+
+            if rect == (0, 0, self.width, self.height):
+                self.tkimage.paste(frame)
+            else:
+                # Copy just the changed pixels into the displayed image
+                self.staging_tkimage.paste(frame)
+                self.root.tk.call(str(self.tkimage), "copy", str(self.staging_tkimage), "-from", *rect, "-to", rect[0], rect[1])
+            self.frames_shown += 1
+
+        self.root.after(self.poll_ms, self.blit_pending_frame)
+
     def clear(self):
         """Clear contents of image buffer"""
  
\ No newline at end of file
@@ -0,0 +1,141 @@
+import atexit
+import logging
+import os
+import threading
+import time
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+
+
+class headlessDisplay:
+    """
+        Display backend with no window: frames land in an in-memory framebuffer.
+        Lets the app run under CI without X and gives a deterministic place to count
+        frames and time screens.
+
+        If `record_dir` is set, every update is also dumped there as a full-screen
+        frame (`record_format` "png" or "raw" RGB bytes) and listed in
+        `frames.csv` with its timestamp and the bounding box of what changed.
+    """
+    RECORD_FORMAT__PNG = "png"
+    RECORD_FORMAT__RAW = "raw"
+
+    def __init__(self, record_dir: str = None, record_format: str = RECORD_FORMAT__PNG):
+        self.width = 240
+        self.height = 240
+
+        self.framebuffer = Image.new("RGB", (self.width, self.height))
+        self.frame_count = 0
+        self.start_time = time.monotonic()
+        self.last_frame_time = None
+        self._stats_frame_count = 0
+        self._stats_start_time = self.start_time
+        self._lock = threading.Lock()
+
+        if record_format not in [self.RECORD_FORMAT__PNG, self.RECORD_FORMAT__RAW]:
+            raise ValueError(f"Unsupported record_format: {record_format}")
+        self.record_dir = record_dir
+        self.record_format = record_format
+        self._index = None
+        if self.record_dir:
+            os.makedirs(self.record_dir, exist_ok=True)
+            self._index = open(os.path.join(self.record_dir, "frames.csv"), "w")
+            self._index.write("frame,timestamp,x_start,y_start,x_end,y_end,filename\n")
+            atexit.register(self.close)
+            logger.info(f"Recording frames to {self.record_dir}")
+
+
+    def close(self):
+        """ Stops recording and closes `frames.csv`; the framebuffer stays usable """
+        with self._lock:
+            if self._index is None:
+                return
+            self._index.close()
+            self._index = None
+        atexit.unregister(self.close)
+
+
+    @property
+    def fps(self) -> float:
+        """ Average frames per second since the display was created (or reset_stats()) """
+        with self._lock:
+            num_frames = self.frame_count - self._stats_frame_count
+            if not num_frames:
+                return 0.0
+            elapsed = self.last_frame_time - self._stats_start_time
+            return num_frames / elapsed if elapsed > 0 else 0.0
+
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats_frame_count = self.frame_count
+            self._stats_start_time = time.monotonic()
+
+
+    def get_frame(self) -> Image.Image:
+        """ Copy of what is currently "onscreen" """
+        with self._lock:
+            return self.framebuffer.copy()
+
+
+    def ShowImage(self, Image2, Xstart, Ystart):
+        imwidth, imheight = Image2.size
+        if imwidth != self.width or imheight != self.height:
+            raise ValueError('Image must be same dimensions as display \
+                ({0}x{1}).' .format(self.width, self.height))
+
+        with self._lock:
+            self.framebuffer.paste(Image2)
+            self._frame_shown((0, 0, self.width, self.height))
+
+
+    def ShowImageRegion(self, Image2, Xstart, Ystart, Xend, Yend):
+        self.ShowImageRegions(Image2, [(Xstart, Ystart, Xend, Yend)])
+
+
+    def ShowImageRegions(self, Image2, rects):
+        """ Applies all of one frame's damaged regions as a single update """
+        if not rects:
+            # Nothing changed; not a new frame
+            return
+
+        with self._lock:
+            for (Xstart, Ystart, Xend, Yend) in rects:
+                self.framebuffer.paste(Image2.crop((Xstart, Ystart, Xend, Yend)), (Xstart, Ystart))
+            self._frame_shown((
+                min(rect[0] for rect in rects),
+                min(rect[1] for rect in rects),
+                max(rect[2] for rect in rects),
+                max(rect[3] for rect in rects),
+            ))
+
+
+    def clear(self):
+        """Clear contents of image buffer"""
+        with self._lock:
+            self.framebuffer.paste((0, 0, 0), (0, 0, self.width, self.height))
+            self._frame_shown((0, 0, self.width, self.height))
+
+
+    def _frame_shown(self, rect):
+        # Caller holds self._lock
+        self.frame_count += 1
+        self.last_frame_time = time.monotonic()
+
+        if not self._index:
+            return
+
+        filename = f"frame_{self.frame_count:06d}.{self.record_format}"
+        path = os.path.join(self.record_dir, filename)
+        if self.record_format == self.RECORD_FORMAT__PNG:
+            self.framebuffer.save(path)
+        else:
+            with open(path, "wb") as f:
+                f.write(self.framebuffer.tobytes())
+
+        timestamp = self.last_frame_time - self.start_time
+        self._index.write(f"{self.frame_count},{timestamp:.6f},{rect[0]},{rect[1]},{rect[2]},{rect[3]},{filename}\n")
+        self._index.flush()
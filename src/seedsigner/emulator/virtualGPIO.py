@@ -3,20 +3,21 @@
 #  to test your code on a desktop enviroment
 #
 #  by: @EnteroPositivo (Twitter, Gmail, GitHub)
-#   
+#
 #  Code adapted from: https://roderickvella.wordpress.com/2016/06/28/raspberry-pi-gpio-emulator/
 
 
+import threading
 import time
 
 
 dictionaryPins = {}
-raisedPin=""
+_pins_lock = threading.RLock()
 
 class GPIO:
 
     #constants
-    LOW = 0 
+    LOW = 0
     HIGH = 1
     OUT = 2
     IN = 3
@@ -25,49 +26,50 @@ class GPIO:
     PUD_UP = 6
     BCM = 7
     BOARD = 101
-
-    SLEEP_TIME_S=0.1
-    SLEEP_TIME_L=1.5
+    RISING = 31
+    FALLING = 32
+    BOTH = 33
 
     #GPIO LIBRARY Functions
     def setmode(mode):
-        time.sleep(GPIO.SLEEP_TIME_L)
-            
+        pass
+
     def setwarnings(flag):
         pass
 
     def setup(channel, state, initial=-1,pull_up_down=-1):
         global dictionaryPins
-        
-        #check if channel is already setup
-        if str(channel) in dictionaryPins:
-            raise Exception('GPIO is already setup')
-
-        if(state == GPIO.OUT):
-            #GPIO is set as output, default OUT 0
-            objTemp =  PIN("OUT")
-            if(initial == GPIO.HIGH):
-                objTemp.Out = "1"
-                
-            dictionaryPins[str(channel)] =objTemp
-            #drawGPIOOut(channel)
-            
-        elif(state == GPIO.IN):
-            #set input
-            objTemp =  PIN("IN")
-            if(pull_up_down == -1):
-                objTemp.pull_up_down = "PUD_DOWN" #by default pud_down
-                objTemp.In = "0"
-            elif(pull_up_down == GPIO.PUD_DOWN):
-                objTemp.pull_up_down = "PUD_DOWN"
-                objTemp.In = "0"
-             
-            elif(pull_up_down == GPIO.PUD_UP):
-                objTemp.pull_up_down = "PUD_UP"
-                objTemp.In = "1"
-                
-            #drawBindUpdateButtonIn(str(channel),objTemp.In)
-            dictionaryPins[str(channel)] =objTemp
+
+        with _pins_lock:
+            #check if channel is already setup
+            if str(channel) in dictionaryPins:
+                raise Exception('GPIO is already setup')
+
+            if(state == GPIO.OUT):
+                #GPIO is set as output, default OUT 0
+                objTemp =  PIN("OUT")
+                if(initial == GPIO.HIGH):
+                    objTemp.Out = "1"
+
+                dictionaryPins[str(channel)] =objTemp
+                #drawGPIOOut(channel)
+
+            elif(state == GPIO.IN):
+                #set input
+                objTemp =  PIN("IN")
+                if(pull_up_down == -1):
+                    objTemp.pull_up_down = "PUD_DOWN" #by default pud_down
+                    objTemp.In = "0"
+                elif(pull_up_down == GPIO.PUD_DOWN):
+                    objTemp.pull_up_down = "PUD_DOWN"
+                    objTemp.In = "0"
+
+                elif(pull_up_down == GPIO.PUD_UP):
+                    objTemp.pull_up_down = "PUD_UP"
+                    objTemp.In = "1"
+
+                #drawBindUpdateButtonIn(str(channel),objTemp.In)
+                dictionaryPins[str(channel)] =objTemp
 
 
     def output(channel, outmode):
@@ -83,10 +85,10 @@ class GPIO:
                 #if channel is setup as IN and used as an OUTPUT
                 raise Exception('GPIO must be setup as OUT')
 
-        
+
         if(outmode != GPIO.LOW and outmode != GPIO.HIGH):
             raise Exception('Output must be set to HIGH/LOW')
-            
+
         objPin = dictionaryPins[channel]
         if(outmode == GPIO.LOW):
             objPin.Out = "0"
@@ -95,51 +97,132 @@ class GPIO:
 
 
     def input(channel):
-        global dictionaryPins, raisedPin
-        global raisedPin
+        """ Current level of the pin; reading it has no side effects """
+        objPin = GPIO._get_input_pin(channel)
+        return GPIO.HIGH if objPin.In == "1" else GPIO.LOW
+
+
+    def cleanup():
+        pass
+
+    def add_event_detect(channel, edge, callback=None, bouncetime=None):
+        """
+            Subscribes `callback(channel)` to `edge` (RISING, FALLING or BOTH) on
+            `channel`. Unlike RPi.GPIO, any number of subscribers may watch the same
+            pin.
+        """
+        objPin = GPIO._get_input_pin(channel)
+        if callback is not None:
+            with _pins_lock:
+                objPin.callbacks.append((edge, callback))
+
+    def add_event_callback(channel, callback):
+        GPIO.add_event_detect(channel, GPIO.BOTH, callback=callback)
+
+    def remove_event_detect(channel):
+        objPin = GPIO._get_input_pin(channel)
+        with _pins_lock:
+            objPin.callbacks = []
 
-        #print(channel)
+    def set_input(gpioID, state):
+        """
+            Emulated button press (HIGH) or release (LOW). Buttons are wired to pull
+            the pin down, so a press drives the pin LOW (FALLING edge) and a release
+            lets it float back HIGH (RISING edge).
+        """
+        #print( "Emulator GPIO:", gpioID, " = ", str(state))
+        GPIO._set_level(gpioID, GPIO.LOW if state == GPIO.HIGH else GPIO.HIGH)
+
+    def press(channel):
+        GPIO.set_input(channel, GPIO.HIGH)
+
+    def release(channel):
+        GPIO.set_input(channel, GPIO.LOW)
+
+    def is_pressed(channel) -> bool:
+        return GPIO.input(channel) == GPIO.LOW
+
+    def last_edge_time(channel, edge):
+        """ time.monotonic() of the pin's last RISING or FALLING edge (None if never) """
+        objPin = GPIO._get_input_pin(channel)
+        return objPin.last_rising if edge == GPIO.RISING else objPin.last_falling
+
+    def play_script(steps, speed: float = 1.0, blocking: bool = True):
+        """
+            Replays scripted input. `steps` is a list of (delay_ms, channel, state)
+            where `state` is GPIO.HIGH (press) or GPIO.LOW (release) as in set_input()
+            and `delay_ms` is relative to the previous step.
+
+            `speed` scales the delays (2.0 = twice as fast); 0 replays with no waits
+            at all. Note that HardwareButtons still applies its repeat thresholds in
+            real time, so at full speed a repeated press of the same key is only
+            relayed if its thresholds allow it. It also queues at most
+            MAX_PENDING_INPUT_EVENTS and ignores events older than
+            MAX_INPUT_EVENT_AGE_MS when wait_for() is called.
+
+            With `blocking=False` the script runs in a daemon thread, which is
+            returned.
+        """
+        def run():
+            for (delay_ms, channel, state) in steps:
+                if speed and delay_ms:
+                    time.sleep(delay_ms / 1000.0 / speed)
+                GPIO.set_input(channel, state)
+
+        if blocking:
+            run()
+            return None
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        return thread
+
+    def tap_script(channels, hold_ms: int = 50, gap_ms: int = 300):
+        """ play_script() steps that press and release each of `channels` in turn """
+        steps = []
+        for channel in channels:
+            steps.append((gap_ms, channel, GPIO.HIGH))
+            steps.append((hold_ms, channel, GPIO.LOW))
+        return steps
+
+    def _get_input_pin(channel):
         channel = str(channel)
-        
+
         if channel not in dictionaryPins:
             #if channel is not setup
             raise Exception('GPIO must be setup before used')
-        else:
-            objPin = dictionaryPins[channel]
-            if(objPin.SetMode == "OUT"):
-                #if channel is setup as OUTPUT and used as an INPUT
-                raise Exception('GPIO must be setup as IN')
-       
+
         objPin = dictionaryPins[channel]
+        if(objPin.SetMode == "OUT"):
+            #if channel is setup as OUTPUT and used as an INPUT
+            raise Exception('GPIO must be setup as IN')
+        return objPin
 
-        if(channel==raisedPin):
-            raisedPin=""
-            return GPIO.LOW
-        else:
-            return GPIO.HIGH
+    def _set_level(channel, level):
+        objPin = GPIO._get_input_pin(channel)
+        new_value = "1" if level == GPIO.HIGH else "0"
 
+        with _pins_lock:
+            if objPin.In == new_value:
+                # No edge
+                return
+            objPin.In = new_value
+            if level == GPIO.HIGH:
+                edge = GPIO.RISING
+                objPin.last_rising = time.monotonic()
+            else:
+                edge = GPIO.FALLING
+                objPin.last_falling = time.monotonic()
+            callbacks = [callback for (cb_edge, callback) in objPin.callbacks if cb_edge in (edge, GPIO.BOTH)]
 
+        # Notify subscribers outside the lock so they're free to read pin state
+        for callback in callbacks:
+            callback(int(channel))
 
-    def cleanup():
-        pass
 
-    def add_event_detect(channel,edge,callback):
-        GPIO.risecallback=callback
-    
-    def set_input(gpioID, state):
-        global raisedPin
 
-        #print( "Emulator GPIO:", gpioID, " = ", str(state))
-        if(state==GPIO.HIGH):
-            raisedPin=str(gpioID)
-            GPIO.risecallback(gpioID)
-        else:
-            raisedPin=""
 
 
-           
-            
-       
 class PIN():
     SetMode = "None" #IN/OUT/NONE
     Out = "0"
@@ -148,4 +231,9 @@ class PIN():
 
     def __init__(self, SetMode):
         self.SetMode = SetMode
-        self.Out = "0"    
+        self.Out = "0"
+
+        # Edge subscribers as (edge, callback) and when each edge last happened
+        self.callbacks = []
+        self.last_rising = None
+        self.last_falling = None
@@ -1,60 +1,125 @@
 
-from threading import Thread
+import logging
+from threading import Condition, Event, Thread
 import time
 import cv2
 
+logger = logging.getLogger(__name__)
+
 
 class WebcamVideoStream:
+	# Per-frame stages reported by get_stage_timings()
+	STAGE__CAPTURE = "capture"
+	STAGE__RESIZE = "resize"
+	STAGE__CONVERT = "convert"
+	ALL_STAGES = [STAGE__CAPTURE, STAGE__RESIZE, STAGE__CONVERT]
+
 	def __init__(self, resolution=(320, 240), framerate=32, format="bgr", **kwargs):
 		# initialize the camera
 		self.camera = cv2.VideoCapture(0, cv2.CAP_DSHOW)
 		self.set_resolution(resolution)
-				
+
+		# Don't let the driver queue up frames behind the one we're about to grab
+		self.camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
 		# initialize the frame and the variable used to indicate
 		# if the thread should be stopped
 		self.frame = None
-		self.should_stop = False
-		self.is_stopped = True
+		self.frame_id = 0
+		self.frame_condition = Condition()
+		self._stop_event = Event()
+		self._thread = None
+
+		self.reset_stage_timings()
+
+	@property
+	def is_stopped(self):
+		return self._thread is None or not self._thread.is_alive()
 
 	def start(self):
 		# start the thread to read frames from the video stream
-		t = Thread(target=self.update, args=())
-		t.daemon = True
-		t.start()
-		self.is_stopped = False
+		self._stop_event.clear()
+		self._thread = Thread(target=self.update, args=())
+		self._thread.daemon = True
+		self._thread.start()
 		return self
 
 	def hasCamera(self):
 		return 	self.camera.isOpened()
 
 	def update(self):
-
-		if self.hasCamera():
-
-			# keep looping infinitely until the thread is stopped
-			while(not self.should_stop):
-				# grab the frame from the stream and clear the stream in
-				# preparation for the next frame
-				ret, stream = self.camera.read()
-				stream = cv2.resize(stream, (240,240))
-				stream = cv2.cvtColor(stream,cv2.COLOR_BGR2RGB)
-				time.sleep(0.05)
-				self.frame = stream
-
-			self.is_stopped = True
-			self.should_stop = False
-			return
-
-		else:
-			self.is_stopped = True
-			self.should_stop = False
+		if not self.hasCamera():
 			return
 
+		# keep looping until the thread is stopped. grab() blocks until the camera
+		# has a new frame, so this runs at the camera's own rate.
+		while not self._stop_event.is_set():
+			start = time.perf_counter()
+			if not self.camera.grab():
+				# Camera hiccup; back off briefly rather than spin
+				self._stop_event.wait(0.01)
+				continue
+			ret, stream = self.camera.retrieve()
+			if not ret:
+				continue
+			captured = time.perf_counter()
+
+			stream = cv2.resize(stream, (240,240))
+			resized = time.perf_counter()
+
+			stream = cv2.cvtColor(stream,cv2.COLOR_BGR2RGB)
+			converted = time.perf_counter()
+
+			with self.frame_condition:
+				self.frame = stream
+				self.frame_id += 1
+				self._stage_totals[self.STAGE__CAPTURE] += captured - start
+				self._stage_totals[self.STAGE__RESIZE] += resized - captured
+				self._stage_totals[self.STAGE__CONVERT] += converted - resized
+				self._num_timed_frames += 1
+				self.frame_condition.notify_all()
 
+		# Wake anyone still waiting on a frame
+		with self.frame_condition:
+			self.frame_condition.notify_all()
 
 	def read(self):
+		# return the frame most recently read
 		return self.frame
-	
+
+	def wait_for_frame(self, last_frame_id=None, timeout=None):
+		"""
+			Blocks until there is a frame newer than `last_frame_id` (or any frame if
+			None), the stream stops, or `timeout` seconds pass. Returns
+			(frame, frame_id); frame is None if nothing new arrived.
+		"""
+		if last_frame_id is None:
+			last_frame_id = 0
+		with self.frame_condition:
+			self.frame_condition.wait_for(
+				lambda: self.frame_id > last_frame_id or self._stop_event.is_set(),
+				timeout=timeout
+			)
+			if self.frame_id > last_frame_id:
+				return (self.frame, self.frame_id)
+			return (None, last_frame_id)
+
+	def get_stage_timings(self):
+		""" Average ms per frame spent in each stage (see ALL_STAGES) plus the frame count """
+		with self.frame_condition:
+			num_frames = self._num_timed_frames
+			timings = {
+				stage: (total / num_frames * 1000 if num_frames else 0.0)
+				for (stage, total) in self._stage_totals.items()
+			}
+		timings["frames"] = num_frames
+		return timings
+
+	def reset_stage_timings(self):
+		with self.frame_condition:
+			self._stage_totals = {stage: 0.0 for stage in self.ALL_STAGES}
+			self._num_timed_frames = 0
+
 	def single_frame():
 		cap = cv2.VideoCapture(0)
 		ret, frame = cap.read()
@@ -62,12 +127,17 @@ class WebcamVideoStream:
 
 	def stop(self):
 		# indicate that the thread should be stopped
-		self.should_stop = True
+		self._stop_event.set()
 
 		# Block in this thread until stopped
-		while not self.is_stopped:
-			pass
+		if self._thread is not None:
+			self._thread.join()
+			self._thread = None
+
+		timings = self.get_stage_timings()
+		logger.debug("WebcamVideoStream: {frames} frames; avg ms capture {capture:0.2f} | resize {resize:0.2f} | convert {convert:0.2f}".format(**timings))
+		self.camera.release()
 
 	def set_resolution(self, resolution):
 		self.camera.set(3, resolution[0])
-		self.camera.set(4, resolution[1])	
+		self.camera.set(4, resolution[1])
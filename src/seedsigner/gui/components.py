@@ -3,9 +3,12 @@ import math
 import os
 import pathlib
 import re
+import threading
 from time import time
 
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from decimal import Decimal
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 from typing import List, Tuple
@@ -208,6 +211,7 @@ def load_image(image_name: str) -> Image.Image:
 class Fonts(Singleton):
     font_path = os.path.join(pathlib.Path(__file__).parent.resolve(), "..", "resources", "fonts")
     fonts = {}
+    char_widths = {}
 
     @classmethod
     def get_font(cls, font_name, size, file_extension: str = "ttf") -> ImageFont.FreeTypeFont:
@@ -230,6 +234,94 @@ class Fonts(Singleton):
         return cls.fonts[font_name][size]
 
 
+    @classmethod
+    def get_text_bbox(cls, font_name, size, text, anchor: str = "ls") -> Tuple[int, int, int, int]:
+        """ Memoized `font.getbbox()` keyed by (font_name, size, text, anchor) """
+        return _get_text_bbox(font_name, size, text, anchor)
+
+
+    @classmethod
+    def get_char_width(cls, font_name, size, char) -> int:
+        """
+        Rendered width (right edge from a left-baseline anchor) of a single glyph,
+        from a per-font table that fills in as new glyphs are seen.
+        """
+        widths = cls.char_widths.get((font_name, size))
+        if widths is None:
+            widths = cls.char_widths[(font_name, size)] = {}
+
+        width = widths.get(char)
+        if width is None:
+            width = widths[char] = cls.get_font(font_name, size).getbbox(char, anchor="ls")[2]
+        return width
+
+
+
+@lru_cache(maxsize=4096)
+def _get_text_bbox(font_name, size, text, anchor):
+    return Fonts.get_font(font_name, size).getbbox(text, anchor=anchor)
+
+
+
+class RenderedImageCache(Singleton):
+    """
+        Content-addressed cache of finished component bitmaps. Keys are tuples of
+        every parameter that affects a component's pixels (but not its position), so
+        re-entering a screen pastes the same TextAreas/Buttons instead of
+        re-rasterizing them.
+
+        Bounded by `max_bytes` of pixel data; least recently used images are evicted
+        first. Cached images are shared: callers must only paste them, never draw on
+        them.
+    """
+    max_bytes = 4 * 1024 * 1024
+    images = OrderedDict()
+    num_bytes = 0
+    hits = 0
+    misses = 0
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, key) -> Image.Image:
+        with cls._lock:
+            image = cls.images.get(key)
+            if image is None:
+                cls.misses += 1
+                return None
+            cls.images.move_to_end(key)
+            cls.hits += 1
+            return image
+
+
+    @classmethod
+    def put(cls, key, image: Image.Image):
+        size = cls._image_size(image)
+        if size > cls.max_bytes:
+            return
+
+        with cls._lock:
+            if key in cls.images:
+                cls.num_bytes -= cls._image_size(cls.images.pop(key))
+            cls.images[key] = image
+            cls.num_bytes += size
+
+            while cls.num_bytes > cls.max_bytes:
+                (_, evicted) = cls.images.popitem(last=False)
+                cls.num_bytes -= cls._image_size(evicted)
+
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls.images.clear()
+            cls.num_bytes = 0
+
+
+    @staticmethod
+    def _image_size(image: Image.Image) -> int:
+        return image.width * image.height * len(image.getbands())
+
+
 
 class TextDoesNotFitException(Exception):
     pass
@@ -326,12 +418,10 @@ class TextArea(BaseComponent):
             )
 
             # Calculate the actual font height from the "baseline" anchor ("_s")
-            font = Fonts.get_font(self.font_name, current_font_size_)
-
             # Note: from the baseline anchor, `top` is a negative number while `bottom`
             # conveys the height of the pixels that rendered below the baseline, if any
             # (e.g. "py" in "python").
-            (left, top, right, bottom) = font.getbbox(self.text, anchor="ls")
+            (left, top, right, bottom) = Fonts.get_text_bbox(self.font_name, current_font_size_, self.text, anchor="ls")
             self.text_height_above_baseline = -1 * top
             self.text_height_below_baseline = bottom
 
@@ -387,6 +477,34 @@ class TextArea(BaseComponent):
         if self.font_size < 20 and (not self.supersampling_factor or self.supersampling_factor == 1):
             self.supersampling_factor = 2
 
+        # Everything below depends only on these params, not on screen_x/screen_y
+        cache_key = (
+            "TextArea",
+            tuple((line["text"], line["text_width"]) for line in self.text_lines),
+            self.width,
+            self.height,
+            self.text_y,
+            self.min_text_x,
+            self.edge_padding,
+            self.is_text_centered,
+            self.height_ignores_below_baseline,
+            self.text_height_above_baseline,
+            self.text_height_below_baseline,
+            self.line_spacing,
+            self.background_color,
+            self.font_name,
+            self.font_size,
+            self.font_color,
+            self.supersampling_factor,
+        )
+        img = RenderedImageCache.get(cache_key)
+        if img is None:
+            img = self._render_image()
+            RenderedImageCache.put(cache_key, img)
+        self.canvas.paste(img, (self.screen_x, self.screen_y))
+
+
+    def _render_image(self) -> Image.Image:
         actual_text_height = self.height
         if self.height_ignores_below_baseline:
             # Even though we're ignoring the pixels below the baseline for spacing
@@ -439,7 +557,7 @@ class TextArea(BaseComponent):
 
             # Crop args are actually (left, top, WIDTH, HEIGHT)
             img = sharpened.crop((0, resample_padding, self.width, actual_text_height + resample_padding))
-        self.canvas.paste(img, (self.screen_x, self.screen_y))
+        return img
 
 
 
@@ -1123,13 +1241,46 @@ class Button(BaseComponent):
             font_color = self.font_color
             outline_color = self.outline_color
 
-        self.image_draw.rounded_rectangle(
-            (
-                self.screen_x,
-                self.screen_y - self.scroll_y,
-                self.screen_x + self.width,
-                self.screen_y + self.height - self.scroll_y
-            ),
+        icon = None
+        if self.icon_name:
+            icon = self.icon_selected if self.is_selected else self.icon
+
+        right_icon = None
+        if self.right_icon_name:
+            right_icon = self.right_icon_selected if self.is_selected else self.right_icon
+
+        # The button's pixels don't depend on where it is onscreen; cache them by
+        # everything else.
+        cache_key = (
+            "Button",
+            self.width,
+            self.height,
+            background_color,
+            outline_color,
+            self.text,
+            (self.font.path, self.font.size) if self.text is not None else None,
+            font_color,
+            (self.text_x, self.text_y, self.text_anchor) if self.text is not None else None,
+            (icon.icon_name, icon.icon_size, icon.icon_color, self.icon_x, self.icon_y) if icon else None,
+            (right_icon.icon_name, right_icon.icon_size, right_icon.icon_color, self.right_icon_x, self.right_icon_y) if right_icon else None,
+        )
+        img = RenderedImageCache.get(cache_key)
+        if img is None:
+            img = self._render_image(background_color, font_color, outline_color, icon, right_icon)
+            RenderedImageCache.put(cache_key, img)
+
+        # Paste through the alpha channel so the canvas still shows behind the
+        # rounded corners.
+        self.canvas.paste(img, (self.screen_x, self.screen_y - self.scroll_y), img)
+
+
+    def _render_image(self, background_color, font_color, outline_color, icon: "Icon", right_icon: "Icon") -> Image.Image:
+        # `rounded_rectangle` includes its end coords, hence the extra px
+        img = Image.new("RGBA", (self.width + 1, self.height + 1), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+
+        draw.rounded_rectangle(
+            (0, 0, self.width, self.height),
             fill=background_color,
             radius=8,
             outline=outline_color,
@@ -1137,29 +1288,22 @@ class Button(BaseComponent):
         )
 
         if self.text is not None:
-            self.image_draw.text(
-                (self.screen_x + self.text_x, self.screen_y + self.text_y - self.scroll_y),
+            draw.text(
+                (self.text_x, self.text_y),
                 self.text,
                 fill=font_color,
                 font=self.font,
                 anchor=self.text_anchor
             )
 
-        if self.icon_name:
-            icon = self.icon
-            if self.is_selected:
-                icon = self.icon_selected
-            icon.screen_y = self.screen_y + self.icon_y - self.scroll_y
-            icon.screen_x = self.screen_x + self.icon_x
-            icon.render()
+        # Same glyph draw as `Icon.render()`, but onto this button's own image
+        if icon:
+            draw.text((self.icon_x, self.icon_y + icon.height), text=icon.icon_name, font=icon.icon_font, fill=icon.icon_color, anchor="ls")
 
-        if self.right_icon_name:
-            icon = self.right_icon
-            if self.is_selected:
-                icon = self.right_icon_selected
-            icon.screen_y = self.screen_y + self.right_icon_y - self.scroll_y
-            icon.screen_x = self.screen_x + self.right_icon_x
-            icon.render()
+        if right_icon:
+            draw.text((self.right_icon_x, self.right_icon_y + right_icon.height), text=right_icon.icon_name, font=right_icon.icon_font, fill=right_icon.icon_color, anchor="ls")
+
+        return img
 
 
 
@@ -1394,14 +1538,26 @@ def reflow_text_for_width(text: str,
     resulting lines of text.
     """    
 
-    if components_current_selected_language in ["JP", "SC", "TC"]:  # Include TC for Traditional Chinese
-        return reflow_text_no_spaces(text, width, font_name, font_size, allow_text_overflow)
+    # Reflowing is deterministic for a given text, width, font and language, so the
+    # result is memoized; hand out copies so callers can't alter the cached lines.
+    text_lines = _reflow_text_for_width(text, width, font_name, font_size, allow_text_overflow, components_current_selected_language)
+    return [{"text": line_text, "text_width": text_width} for (line_text, text_width) in text_lines]
+
+
+
+@lru_cache(maxsize=512)
+def _reflow_text_for_width(text: str, width: int, font_name, font_size, allow_text_overflow: bool, language: str) -> tuple:
+    if language in ["JP", "SC", "TC"]:  # Include TC for Traditional Chinese
+        text_lines = reflow_text_no_spaces(text, width, font_name, font_size, allow_text_overflow)
     else:
-        return reflow_text_with_spaces(text, width, font_name, font_size, allow_text_overflow)
+        text_lines = reflow_text_with_spaces(text, width, font_name, font_size, allow_text_overflow)
+    return tuple((line["text"], line["text_width"]) for line in text_lines)
+
+
+
 
 def reflow_text_no_spaces(text: str, width: int, font_name, font_size, allow_text_overflow: bool) -> list[dict]:
 
-    font = Fonts.get_font(font_name=font_name, size=font_size)
     text_lines = []
     
     current_line = ""
@@ -1414,7 +1570,7 @@ def reflow_text_no_spaces(text: str, width: int, font_name, font_size, allow_tex
             current_width = 0
             continue
 
-        char_width = font.getbbox(char, anchor="ls")[2]  # Get the width of the character
+        char_width = Fonts.get_char_width(font_name, font_size, char)  # Get the width of the character
         
         if current_width + char_width > width:
             # If adding this character would exceed the width, add the current line to text_lines
@@ -1437,9 +1593,8 @@ def reflow_text_with_spaces(text: str, width: int, font_name, font_size, allow_t
     #   fits in its bounding rect (plus accounting for edge padding) using its given
     #   font.
     start = time()
-    font = Fonts.get_font(font_name=font_name, size=font_size)
     # Measure from left baseline ("ls")
-    (left, top, full_text_width, bottom) = font.getbbox(text, anchor="ls")
+    (left, top, full_text_width, bottom) = Fonts.get_text_bbox(font_name, font_size, text, anchor="ls")
 
     # Stores each line of text and its rendering starting x-coord
     text_lines = []
@@ -1460,7 +1615,7 @@ def reflow_text_with_spaces(text: str, width: int, font_name, font_size, allow_t
                 index = 1
 
             # Measure rendered width from "left" anchor (anchor="l_")
-            (left, top, right, bottom) = font.getbbox(" ".join(words[0:index]), anchor="ls")
+            (left, top, right, bottom) = Fonts.get_text_bbox(font_name, font_size, " ".join(words[0:index]), anchor="ls")
             line_width = right - left
 
             if line_width >= width:
@@ -1470,7 +1625,7 @@ def reflow_text_with_spaces(text: str, width: int, font_name, font_size, allow_t
                         if components_current_selected_language == "DE" and len(words[0]) >= 15:
                             split_point = 1
                             while split_point < len(words[0]):
-                                (left, top, right, bottom) = font.getbbox(words[0][:split_point], anchor="ls")
+                                (left, top, right, bottom) = Fonts.get_text_bbox(font_name, font_size, words[0][:split_point], anchor="ls")
                                 if right - left >= width:
                                     break
                                 split_point += 1
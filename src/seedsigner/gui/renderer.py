@@ -1,10 +1,15 @@
-from PIL import Image, ImageDraw
+import logging
+
+from PIL import Image, ImageChops, ImageDraw
 from threading import Lock
 
 from seedsigner.gui.components import Fonts, GUIConstants
 #from seedsigner.hardware.ST7789 import ST7789
-from seedsigner.emulator.desktopDisplay import desktopDisplay
 from seedsigner.models.singleton import ConfigurableSingleton
+from seedsigner.models.threads import BaseThread, ThreadsafeMailbox
+
+
+logger = logging.getLogger(__name__)
 
 
 
@@ -17,27 +22,73 @@ class Renderer(ConfigurableSingleton):
     disp = None
     lock = Lock()
 
+    DISPLAY__DESKTOP = "desktop"
+    DISPLAY__HEADLESS = "headless"
+    ALL_DISPLAYS = [DISPLAY__DESKTOP, DISPLAY__HEADLESS]
+
+    # Copy of what the display is currently showing; None when unknown (forces a
+    # full-screen update).
+    front: Image.Image = None
+
+    # Height of the horizontal bands that changed pixels are grouped into
+    DAMAGE_BAND_HEIGHT = 16
+
+    # Pushes finished frames to `disp`; if None, frames are sent synchronously
+    flush_thread: "DisplayFlushThread" = None
+
 
     @classmethod
-    def configure_instance(cls):
+    def configure_instance(cls, display: str = DISPLAY__DESKTOP, **display_kwargs):
+        """
+            `display` selects the display backend; any `display_kwargs` are passed to
+            its constructor (e.g. `record_dir` for the headless display).
+        """
+        if cls._instance is not None:
+            # Reconfiguring; don't leave the old thread running (and holding on to
+            # the old display)
+            if cls._instance.flush_thread is not None:
+                cls._instance.flush_thread.stop()
+                cls._instance.flush_thread.join()
+            if hasattr(cls._instance.disp, "close"):
+                cls._instance.disp.close()
+
         # Instantiate the one and only Renderer instance
         renderer = cls.__new__(cls)
         cls._instance = renderer
 
         # Eventually we'll be able to plug in other display controllers
         #renderer.disp = ST7789()
-        renderer.disp = desktopDisplay()
+        if display == cls.DISPLAY__DESKTOP:
+            # Only import tkinter when we actually want a window
+            from seedsigner.emulator.desktopDisplay import desktopDisplay
+            renderer.disp = desktopDisplay(**display_kwargs)
+        elif display == cls.DISPLAY__HEADLESS:
+            from seedsigner.emulator.headlessDisplay import headlessDisplay
+            renderer.disp = headlessDisplay(**display_kwargs)
+        else:
+            raise ValueError(f"Unsupported display: {display}")
         renderer.canvas_width = renderer.disp.width
         renderer.canvas_height = renderer.disp.height
 
         renderer.canvas = Image.new('RGB', (renderer.canvas_width, renderer.canvas_height))
         renderer.draw = ImageDraw.Draw(renderer.canvas)
 
+        renderer.flush_thread = DisplayFlushThread(renderer)
+        renderer.flush_thread.start()
+
 
     def show_image(self, image=None, alpha_overlay=None, show_direct=False):
+        """
+            `canvas` is the back buffer: callers draw into it (under `lock`) and then
+            call show_image() to hand a snapshot of it off to the flush thread. This
+            returns without waiting on the display transfer.
+
+            A `show_direct` image is handed off as-is, so the caller must not draw on
+            it afterwards.
+        """
         if show_direct:
             # Use the incoming image as the canvas and immediately render
-            self.disp.ShowImage(image, 0, 0)
+            self.submit_frame(image, is_direct=True)
             return
 
         if alpha_overlay:
@@ -49,7 +100,87 @@ class Renderer(ConfigurableSingleton):
             # Always write to the current canvas, rather than trying to replace it
             self.canvas.paste(image)
 
-        self.disp.ShowImage(self.canvas, 0, 0)
+        self.submit_frame(self.canvas.copy())
+
+
+    def submit_frame(self, frame: Image.Image, is_direct: bool = False, wait: bool = False):
+        if self.flush_thread is None:
+            self.flush_frame(frame, is_direct)
+        else:
+            self.flush_thread.submit(frame, is_direct=is_direct, wait=wait)
+
+
+    def wait_for_flush(self):
+        """ Blocks until every frame submitted so far is onscreen (or was superseded) """
+        if self.flush_thread is not None:
+            self.flush_thread.wait_for_flush()
+
+
+    def flush_frame(self, frame: Image.Image, is_direct: bool = False):
+        """ Writes `frame` to the display. Only called from one thread at a time. """
+        if is_direct:
+            self.disp.ShowImage(frame, 0, 0)
+            self.front = None
+            return
+
+        damaged_rects = self.get_damaged_rects(frame)
+        if damaged_rects == []:
+            # Identical to what is already onscreen
+            return
+
+        if damaged_rects is None:
+            self.disp.ShowImage(frame, 0, 0)
+        elif hasattr(self.disp, "ShowImageRegions"):
+            # Display wants the whole frame's damage at once (e.g. to count frames)
+            self.disp.ShowImageRegions(frame, damaged_rects)
+        else:
+            for rect in damaged_rects:
+                self.disp.ShowImageRegion(frame, *rect)
+
+        # Frames are private snapshots so it can be kept as-is
+        self.front = frame
+
+
+    def get_damaged_rects(self, frame: Image.Image):
+        """
+            Returns the (x_start, y_start, x_end, y_end) regions of `frame` that
+            differ from what is currently onscreen, or None if the whole screen must be
+            sent.
+
+            Damage is found by diffing against the last frame that was sent rather than
+            having each component report what it drew; screens also draw straight
+            onto `self.draw` and every one of those paths would otherwise need to
+            report too.
+
+            Changed rows are grouped into DAMAGE_BAND_HEIGHT bands; touching bands
+            are merged into one rect spanning their combined x extent.
+        """
+        if self.front is None or not hasattr(self.disp, "ShowImageRegion"):
+            return None
+
+        diff = ImageChops.difference(self.front, frame)
+        bbox = diff.getbbox()
+        if bbox is None:
+            return []
+
+        rects = []
+        for band_top in range(bbox[1], bbox[3], self.DAMAGE_BAND_HEIGHT):
+            band_bottom = min(band_top + self.DAMAGE_BAND_HEIGHT, bbox[3])
+            band_bbox = diff.crop((bbox[0], band_top, bbox[2], band_bottom)).getbbox()
+            if band_bbox is None:
+                continue
+
+            rect = [bbox[0] + band_bbox[0], band_top + band_bbox[1], bbox[0] + band_bbox[2], band_top + band_bbox[3]]
+            if rects and rects[-1][3] > band_top - self.DAMAGE_BAND_HEIGHT:
+                # The band just above was also damaged; extend its rect
+                prev = rects[-1]
+                prev[0] = min(prev[0], rect[0])
+                prev[2] = max(prev[2], rect[2])
+                prev[3] = rect[3]
+            else:
+                rects.append(rect)
+
+        return [tuple(rect) for rect in rects]
 
 
     def show_image_pan(self, image, start_x, start_y, end_x, end_y, rate, alpha_overlay=None):
@@ -83,10 +214,59 @@ class Renderer(ConfigurableSingleton):
             # Always keep a copy of the current display in the canvas
             self.canvas.paste(crop)
 
-            self.disp.ShowImage(crop, 0, 0)
+            # The pan is paced by the display, so wait for each step to go out
+            self.submit_frame(self.canvas.copy(), wait=True)
 
 
 
     def display_blank_screen(self):
         self.draw.rectangle((0, 0, self.canvas_width, self.canvas_height), outline=0, fill=0)
         self.show_image()
+
+
+
+class DisplayFlushThread(BaseThread):
+    """
+        Single consumer that pushes frames to the display so that producers (screens,
+        the live preview, QR animation, toasts, screensaver) never block on the
+        SPI/Tk transfer.
+
+        Frames go through a latest-wins mailbox: a frame submitted while an older
+        one is still waiting replaces it, so the display always catches up to the
+        most recent frame and stale intermediate frames are dropped.
+    """
+    def __init__(self, renderer: Renderer):
+        super().__init__()
+        self.renderer = renderer
+        self.frames = ThreadsafeMailbox()
+
+
+    def submit(self, frame: Image.Image, is_direct: bool = False, wait: bool = False):
+        sequence = self.frames.put((frame, is_direct))
+        if wait:
+            self.frames.wait_until_done(sequence)
+
+
+    def wait_for_flush(self):
+        self.frames.wait_until_done()
+
+
+    def stop(self):
+        super().stop()
+        self.frames.close()
+
+
+    def run(self):
+        while self.keep_running:
+            pending = self.frames.take()
+            if pending is None:
+                # Closed
+                continue
+            (frame, is_direct) = pending
+
+            try:
+                self.renderer.flush_frame(frame, is_direct)
+            except Exception as e:
+                logger.exception(e)
+
+            self.frames.mark_done()
@@ -1,7 +1,6 @@
 from dataclasses import dataclass
 from PIL import ImageFont, ImageDraw
-import os
-from seedsigner.gui.components import TextArea, Button, GUIConstants
+from seedsigner.gui.components import Fonts, TextArea, Button, GUIConstants
 from seedsigner.gui.screens.screen import BaseScreen
 from seedsigner.hardware.buttons import HardwareButtonsConstants
 
@@ -22,25 +21,21 @@ class LanguageSelectionScreen(BaseScreen):
         )
         self.components.append(self.title)
 
-        # 폰트 경로 설정
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        font_dir = os.path.join(current_dir, '..', '..', 'resources', 'fonts')
-
-        # 폰트 파일명과 크기 설정
-        self.fonts = {
-            '한국어': ImageFont.truetype(os.path.join(font_dir, 'NotoSansKR-SemiBold.ttf'), GUIConstants.BODY_FONT_MAX_SIZE),
-            'English': ImageFont.truetype(os.path.join(font_dir, 'NotoSansEN-SemiBold.ttf'), GUIConstants.BODY_FONT_MAX_SIZE),
-            '日本語': ImageFont.truetype(os.path.join(font_dir, 'NotoSansJP-SemiBold.ttf'), GUIConstants.BODY_FONT_MAX_SIZE),
-            '中文': ImageFont.truetype(os.path.join(font_dir, 'NotoSansSC-SemiBold.ttf'), GUIConstants.BODY_FONT_MAX_SIZE),
-            'Hongkong': ImageFont.truetype(os.path.join(font_dir, 'NotoSansHK-SemiBold.ttf'), GUIConstants.BODY_FONT_MAX_SIZE),
+        # Only the font *names* are resolved up front; each Noto font is loaded (and
+        # cached by Fonts) the first time its language label is actually drawn.
+        self.font_names = {
+            '한국어': 'NotoSansKR-SemiBold',
+            'English': 'NotoSansEN-SemiBold',
+            '日本語': 'NotoSansJP-SemiBold',
+            '中文': 'NotoSansSC-SemiBold',
+            'Hongkong': 'NotoSansHK-SemiBold',
         }
         self.language_list = [
             "English", "한국어", "Español", "Français", 
             "Deutsch", "中文", "日本語", "Italiano"
         ]
-        # Create a list of languages with appropriate fonts
         self.languages = [
-            {"text": lang, "font": self.fonts.get(lang, self.fonts['English'])}
+            {"text": lang, "font_name": self.font_names.get(lang, self.font_names['English'])}
             for lang in self.language_list
         ]
 
@@ -63,6 +58,9 @@ class LanguageSelectionScreen(BaseScreen):
         self.scroll_offset = 0
         self.dropdown_padding = 5
         self.focused_dropdown_index = 0 
+    def get_language_font(self, language: dict) -> ImageFont.FreeTypeFont:
+        return Fonts.get_font(language["font_name"], GUIConstants.BODY_FONT_MAX_SIZE)
+
     def create_dropdown_button(self):
         button_width = 200
         button_height = 40
@@ -182,7 +180,7 @@ class LanguageSelectionScreen(BaseScreen):
                 item_y = dropdown_y + i * item.height
                 
                 # 각 언어에 맞는 폰트로 텍스트 그리기
-                lang_font = next(lang["font"] for lang in self.languages if lang["text"] == item.text)
+                lang_font = next(self.get_language_font(lang) for lang in self.languages if lang["text"] == item.text)
                 text_color = GUIConstants.BUTTON_SELECTED_FONT_COLOR if i == self.focused_dropdown_index else GUIConstants.BUTTON_FONT_COLOR
                 background_color = GUIConstants.ACCENT_COLOR if i == self.focused_dropdown_index else GUIConstants.BACKGROUND_COLOR
                 
@@ -258,7 +256,7 @@ class LanguageSelectionScreen(BaseScreen):
                 elif self.is_dropdown_open:
                     self.selected_index = self.scroll_offset + self.focused_dropdown_index
                     self.dropdown_button.text = self.languages[self.selected_index]["text"]
-                    self.dropdown_button.font = self.languages[self.selected_index]["font"]
+                    self.dropdown_button.font = self.get_language_font(self.languages[self.selected_index])
                     self.is_dropdown_open = False
                     self.clear_dropdown()
 
@@ -284,7 +282,7 @@ class LanguageSelectionScreen(BaseScreen):
                     
                     # Update dropdown button text and font
                     self.dropdown_button.text = self.languages[self.selected_index]["text"]
-                    self.dropdown_button.font = self.languages[self.selected_index]["font"]
+                    self.dropdown_button.font = self.get_language_font(self.languages[self.selected_index])
                 else:
                     if self.focused_component == self.dropdown_button:
                         self.focused_component = self.confirm_button
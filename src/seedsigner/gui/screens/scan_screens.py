@@ -1,3 +1,5 @@
+import os
+import queue
 import time
 
 from dataclasses import dataclass
@@ -7,7 +9,7 @@ from seedsigner.gui import renderer
 from seedsigner.hardware.buttons import HardwareButtonsConstants
 from seedsigner.hardware.camera import Camera
 from seedsigner.models.decode_qr import DecodeQR, DecodeQRStatus
-from seedsigner.models.threads import BaseThread, ThreadsafeCounter
+from seedsigner.models.threads import BaseThread, ThreadsafeCounter, ThreadsafeMailbox
 
 from .screen import BaseScreen
 from ..components import GUIConstants, Fonts, SeedSignerIconConstants
@@ -18,11 +20,17 @@ from ..components import GUIConstants, Fonts, SeedSignerIconConstants
 @dataclass
 class ScanScreen(BaseScreen):
     """
-    Live preview has to balance three competing threads:
+    Live preview has to balance three competing jobs:
     * Camera capturing frames and making them available to read.
     * Decoder analyzing frames for QR codes.
     * Live preview display writing frames to the screen.
 
+    The preview and the decoder each run at their own pace. The FrameFeederThread
+    drops each new camera frame into a latest-wins mailbox. `decode_workers`
+    DecodeWorkerThreads take frames from it and run zbar in parallel; a frame that
+    no worker was free for is simply replaced by the next one. Their results are
+    fed to `DecodeQR.add_data` one at a time by `_run()`.
+
     All of this would ideally be rewritten as in C/C++/Rust with python bindings for
     vastly improved performance.
 
@@ -46,6 +54,8 @@ class ScanScreen(BaseScreen):
     resolution: tuple[int,int] = (480, 480)
     framerate: int = 6  # TODO: alternate optimization for Pi Zero 2W?
     render_rect: tuple[int,int,int,int] = None
+    decode_roi: float = None  # e.g. 0.75 to only decode the centred 75% of each dimension
+    decode_workers: int = None  # defaults to one per core, leaving a core for the preview (max 3)
 
     FRAME__ADDED_PART = 1
     FRAME__REPEATED_PART = 2
@@ -74,6 +84,74 @@ class ScanScreen(BaseScreen):
             frames_decoded_counter=self.frames_decoded_counter,
         ))
 
+        if not self.decode_workers:
+            self.decode_workers = max(1, min(3, (os.cpu_count() or 1) - 1))
+
+        self.frame_mailbox = ThreadsafeMailbox()
+        self.decode_results = queue.Queue()
+        self.threads.append(ScanScreen.FrameFeederThread(
+            camera=self.camera,
+            frame_mailbox=self.frame_mailbox,
+        ))
+        for i in range(self.decode_workers):
+            self.threads.append(ScanScreen.DecodeWorkerThread(
+                camera=self.camera,
+                frame_mailbox=self.frame_mailbox,
+                decode_results=self.decode_results,
+                decode_roi=self.decode_roi,
+            ))
+
+
+    class FrameFeederThread(BaseThread):
+        """ Hands each new camera frame to the decode workers, newest first """
+        def __init__(self, camera: Camera, frame_mailbox: ThreadsafeMailbox):
+            self.camera = camera
+            self.frame_mailbox = frame_mailbox
+            super().__init__()
+
+
+        def run(self):
+            frame_id = None
+            while self.keep_running:
+                frame, frame_id = self.camera.wait_for_video_stream(frame_id, timeout=0.1)
+                if frame is not None:
+                    self.frame_mailbox.put(frame)
+
+                elif not self.camera.is_video_stream_running:
+                    break
+
+            # Release any workers still waiting on a frame
+            self.frame_mailbox.close()
+
+
+
+    class DecodeWorkerThread(BaseThread):
+        """
+            Runs zbar on the newest frame from the mailbox. zbar is called through
+            ctypes, which releases the GIL, so several workers decode in parallel.
+        """
+        def __init__(self, camera: Camera, frame_mailbox: ThreadsafeMailbox, decode_results: queue.Queue, decode_roi: float = None):
+            self.camera = camera
+            self.frame_mailbox = frame_mailbox
+            self.decode_results = decode_results
+            self.decode_roi = decode_roi
+            super().__init__()
+
+
+        def run(self):
+            while self.keep_running:
+                frame = self.frame_mailbox.take(timeout=0.1)
+                if frame is None:
+                    if self.frame_mailbox.is_closed:
+                        # The feeder has stopped; take() would now return at once
+                        break
+                    continue
+
+                frame = self.camera.to_decode_frame(frame, roi=self.decode_roi)
+
+                # None if there was no QR in the frame; `_run()` counts that as a miss
+                self.decode_results.put(DecodeQR.extract_qr_data(frame, is_binary=True))
+
 
     class LivePreviewThread(BaseThread):
         def __init__(self, camera: Camera, decoder: DecodeQR, renderer: renderer.Renderer, instructions_text: str, render_rect: tuple[int,int,int,int], frame_decode_status: ThreadsafeCounter, frames_decoded_counter: ThreadsafeCounter):
@@ -251,9 +329,16 @@ class ScanScreen(BaseScreen):
         num_frames = 0
         start_time = time.time()
         while True:
-            frame = self.camera.read_video_stream()
-            if frame is not None:
-                status = self.decoder.add_image(frame)
+            try:
+                # Wake up at least every 50ms to check for input
+                data = self.decode_results.get(timeout=0.05)
+                has_result = True
+            except queue.Empty:
+                has_result = False
+
+            if has_result:
+                # The only caller of add_data(), so the decoder needs no locking
+                status = self.decoder.add_data(data)
 
                 num_frames += 1
                 decoder_fps = f"{num_frames / (time.time() - start_time):0.2f}"
@@ -277,8 +362,8 @@ class ScanScreen(BaseScreen):
                     elif status == DecodeQRStatus.PART_EXISTING:
                         # We received a valid frame, but we've already seen in
                         self.frames_decode_status.set_value(self.FRAME__REPEATED_PART)
-                
-                if self.hw_inputs.check_for_low(HardwareButtonsConstants.KEY_RIGHT) or self.hw_inputs.check_for_low(HardwareButtonsConstants.KEY_LEFT):
-                    self.camera.stop_video_stream_mode()
-                    break
+
+            if self.hw_inputs.check_for_low(HardwareButtonsConstants.KEY_RIGHT) or self.hw_inputs.check_for_low(HardwareButtonsConstants.KEY_LEFT):
+                self.camera.stop_video_stream_mode()
+                break
 
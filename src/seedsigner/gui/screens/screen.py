@@ -1,6 +1,7 @@
 import os
 import time
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from PIL import Image, ImageDraw, ImageColor, ImageFont
 from typing import Any, List, Tuple
@@ -11,13 +12,14 @@ from seedsigner.gui.components import (GUIConstants,
 from seedsigner.gui.keyboard import Keyboard, TextEntryDisplay
 from seedsigner.gui.renderer import Renderer
 from seedsigner.hardware.buttons import HardwareButtonsConstants, HardwareButtons
+from seedsigner.helpers.qr import QR
 from seedsigner.models.encode_qr import BaseQrEncoder
 from seedsigner.models.settings import SettingsConstants
 from seedsigner.models.threads import BaseThread, ThreadsafeCounter
 from seedsigner.models.language_translation import LanguageTranslation
 screen_current_selected_language="EN"
 def translator(text):
-    return LanguageTranslation(screen_current_selected_language).translate(text)
+    return LanguageTranslation.get_instance(screen_current_selected_language).translate(text)
 
 # Must be huge numbers to avoid conflicting with the selected_button returned by the
 #   screens with buttons.
@@ -838,6 +840,9 @@ class QRDisplayScreen(BaseScreen):
     qr_encoder: BaseQrEncoder = None
 
     class QRDisplayThread(BaseThread):
+        MAX_CACHED_PARTS = 256
+        MAX_CACHED_FRAMES = 16
+
         def __init__(self, qr_encoder: BaseQrEncoder, qr_brightness: ThreadsafeCounter, renderer: Renderer,
                      tips_start_time: ThreadsafeCounter):
             super().__init__()
@@ -846,6 +851,44 @@ class QRDisplayScreen(BaseScreen):
             self.renderer = renderer
             self.tips_start_time = tips_start_time
 
+            # Each part is rasterized at one pixel per module once (a few KB each);
+            # brightness changes only swap the background palette entry. The scaled
+            # 240x240 frames (~230 KB each) are kept for the most recent few, which
+            # covers static QRs and short animations. Both are LRUs.
+            self.module_cache = OrderedDict()
+            self.frame_cache = OrderedDict()
+
+
+        @staticmethod
+        def _cache_get(cache: OrderedDict, key):
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+
+
+        @staticmethod
+        def _cache_put(cache: OrderedDict, key, value, max_entries: int):
+            cache[key] = value
+            if len(cache) > max_entries:
+                cache.popitem(last=False)
+
+
+        def part_image(self, part: str, background_color: str) -> Image.Image:
+            """ The scaled frame for `part`; shared with the cache, so don't draw on it """
+            frame = self._cache_get(self.frame_cache, (part, background_color))
+            if frame is not None:
+                return frame
+
+            modules = self._cache_get(self.module_cache, part)
+            if modules is None:
+                modules = self.qr_encoder.part_to_palette_image(part, border=2)
+                self._cache_put(self.module_cache, part, modules, self.MAX_CACHED_PARTS)
+
+            frame = QR.palette_to_image(modules, 240, 240, background_color=background_color)
+            self._cache_put(self.frame_cache, (part, background_color), frame, self.MAX_CACHED_FRAMES)
+            return frame
+
 
         def render_brightness_tip(self, image: Image.Image) -> None:
             # TODO: Refactor ToastOverlay to support two lines of icon + text and use
@@ -934,7 +977,7 @@ class QRDisplayScreen(BaseScreen):
                 # Display the brightness tips toast
                 duration = 10 ** 9 * 1.2  # 1.2 seconds
                 if is_brightness_tip_enabled and time.time_ns() - self.tips_start_time.cur_count < duration:
-                    image = self.qr_encoder.part_to_image(self.qr_encoder.cur_part(), 240, 240, border=2, background_color=hex_color)
+                    image = self.part_image(self.qr_encoder.cur_part(), hex_color).copy()
                     self.render_brightness_tip(image)
                     pending_encoder_restart = True
                 else:
@@ -944,7 +987,7 @@ class QRDisplayScreen(BaseScreen):
                         # brightness tip is stowed.
                         self.qr_encoder.restart()
                         pending_encoder_restart = False
-                    image = self.qr_encoder.next_part_image(240, 240, border=2, background_color=hex_color)
+                    image = self.part_image(self.qr_encoder.next_part(), hex_color)
 
                 with self.renderer.lock:
                     self.renderer.show_image(image)
@@ -133,7 +133,7 @@ class BaseToastOverlayManagerThread(BaseThread):
                 # User has pressed a button, cancel the toast
                 logger.info(f"{self.__class__.__name__}: Canceling toast due to user input")
                 return
-            time.sleep(0.1)
+            self.hw_inputs.wait_for_any_input(timeout=max(self.activation_delay - (time.time() - start), 0))
 
         try:
             # Hold onto the Renderer lock so we're guaranteed to restore the original
@@ -176,8 +176,8 @@ class BaseToastOverlayManagerThread(BaseThread):
                     logger.info(f"{self.__class__.__name__}: Hiding toast")
                     break
 
-                # Free up cpu resources for main thread
-                time.sleep(0.1)
+                # Free up cpu resources for main thread; wakes early on user input
+                self.hw_inputs.wait_for_any_input(timeout=0.1)
 
         finally:
             logger.info(f"{self.__class__.__name__}: exiting")
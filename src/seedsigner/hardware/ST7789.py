@@ -1,13 +1,31 @@
+import numpy as np
+import PIL.Image
 import spidev
 import RPi.GPIO as GPIO
 import time
-import array
+import warnings
+
+
+
+def _pillow_has_bgr16() -> bool:
+    # Pillow < 12 has a C converter to "BGR;16" (deprecated since 10.4, removed in 12)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        try:
+            PIL.Image.new("RGB", (1, 1)).convert("BGR;16")
+        except ValueError:
+            return False
+    return True
 
 
 
 class ST7789(object):
     """class for ST7789  240*240 1.3inch OLED displays."""
 
+    # Where available, Pillow's own converter is about twice as fast as the numpy
+    # packing in to_rgb565()
+    USE_PILLOW_BGR16 = _pillow_has_bgr16()
+
     def __init__(self):
         self.width = 240
         self.height = 240
@@ -28,6 +46,12 @@ class ST7789(object):
         self._spi = spidev.SpiDev(0, 0)
         self._spi.max_speed_hz = 40000000
 
+        # Persistent RGB565 framebuffer plus 32-bit working space for the conversion
+        # so frames don't allocate; partial updates use a prefix of each.
+        self._framebuffer = np.empty(self.width * self.height, dtype="<u2")
+        self._accum = np.empty(self.width * self.height, dtype="<u4")
+        self._scratch = np.empty(self.width * self.height, dtype="<u4")
+
         self.init()
 
 
@@ -153,13 +177,55 @@ class ST7789(object):
         if imwidth != self.width or imheight != self.height:
             raise ValueError('Image must be same dimensions as display \
                 ({0}x{1}).' .format(self.width, self.height))
-        # convert 24-bit RGB-8:8:8 to gBRG-3:5:5:3; then per-pixel byteswap to 16-bit RGB-5:6:5
-        arr = array.array("H", Image.convert("BGR;16").tobytes())
-        arr.byteswap()
-        pix = arr.tobytes()
+        pix = self.to_rgb565(Image)
         self.SetWindows ( 0, 0, self.width, self.height)
         GPIO.output(self._dc,GPIO.HIGH)
         self._spi.writebytes2(pix)	
+
+    def ShowImageRegion(self, Image, Xstart, Ystart, Xend, Yend):
+        """Write only the (Xstart, Ystart, Xend, Yend) region of a full-screen image"""
+        pix = self.to_rgb565(Image.crop((Xstart, Ystart, Xend, Yend)))
+        self.SetWindows(Xstart, Ystart, Xend, Yend)
+        GPIO.output(self._dc,GPIO.HIGH)
+        self._spi.writebytes2(pix)
+
+    def to_rgb565(self, Image):
+        """
+        Converts an RGB image to RGB-5:6:5 in the reused framebuffer and returns a
+        big-endian view of the filled portion, ready for the SPI write.
+        """
+        if Image.mode != "RGB":
+            Image = Image.convert("RGB")
+        num_pixels = Image.width * Image.height
+        pixels = self._framebuffer[:num_pixels]
+
+        if self.USE_PILLOW_BGR16:
+            # gBRG-3:5:5:3 words; reading them big-endian into the little-endian
+            # framebuffer is the per-pixel byteswap to RGB-5:6:5
+            np.copyto(pixels, np.frombuffer(Image.convert("BGR;16").tobytes(), dtype=">u2"))
+            return pixels.view(">u2")
+
+        # One contiguous 0x00BBGGRR word per pixel
+        rgbx = np.frombuffer(Image.tobytes("raw", "RGBX"), dtype="<u4")
+        accum = self._accum[:num_pixels]
+        scratch = self._scratch[:num_pixels]
+
+        # Build each pixel's two output bytes, high byte (rrrrrggg) in bits 0-7 and
+        # low byte (gggbbbbb) in bits 8-15, so the little-endian u16 store below
+        # lays them out in the order the panel expects.
+        np.bitwise_and(rgbx, 0xF8, out=accum)           # r[7:3]
+        np.right_shift(rgbx, 13, out=scratch)
+        np.bitwise_and(scratch, 0x07, out=scratch)      # g[7:5]
+        np.bitwise_or(accum, scratch, out=accum)
+        np.left_shift(rgbx, 3, out=scratch)
+        np.bitwise_and(scratch, 0xE000, out=scratch)    # g[4:2]
+        np.bitwise_or(accum, scratch, out=accum)
+        np.right_shift(rgbx, 11, out=scratch)
+        np.bitwise_and(scratch, 0x1F00, out=scratch)    # b[7:3]
+        np.bitwise_or(accum, scratch, out=accum)
+
+        np.copyto(pixels, accum, casting="unsafe")
+        return pixels.view(">u2")
         
     def clear(self):
         """Clear contents of image buffer"""
@@ -1,6 +1,8 @@
+from collections import deque
 from typing import List
 #import RPi.GPIO as GPIO
 from seedsigner.emulator.virtualGPIO import GPIO
+import threading
 import time
 
 from seedsigner.models.singleton import Singleton
@@ -17,6 +19,12 @@ class HardwareButtons(Singleton):
     KEY2_PIN = 20
     KEY3_PIN = 16
 
+    # Screens that never call wait_for() let events pile up; wait_for() and
+    # has_input_event() ignore presses older than this and the queue drops its
+    # oldest beyond the max.
+    MAX_INPUT_EVENT_AGE_MS = 500
+    MAX_PENDING_INPUT_EVENTS = 1024
+
     @classmethod
     def get_instance(cls):
         # This is the only way to access the one and only instance
@@ -37,6 +45,12 @@ class HardwareButtons(Singleton):
             cls._instance.GPIO = GPIO
             cls._instance.override_ind = False
 
+            # Key presses and releases arrive via the GPIO edge callbacks as
+            # (key, timestamp ms, is_press) events; `input_condition` guards the deque
+            # and wakes anyone waiting on it.
+            cls._instance.input_events = deque()
+            cls._instance.input_condition = threading.Condition()
+
             cls._instance.add_events([HardwareButtonsConstants.KEY_UP, HardwareButtonsConstants.KEY_DOWN, HardwareButtonsConstants.KEY_PRESS, HardwareButtonsConstants.KEY_LEFT, HardwareButtonsConstants.KEY_RIGHT, HardwareButtonsConstants.KEY1, HardwareButtonsConstants.KEY2, HardwareButtonsConstants.KEY3])
 
             # Track state over time so we can apply input delays/ignores as needed
@@ -58,6 +72,14 @@ class HardwareButtons(Singleton):
             release_keys = keys
         self.override_ind = False
 
+        # Stale presses (e.g. made on a screen that never waited for them) must not
+        # be replayed here as fresh input
+        self.clear_input_events(before=int(time.time() * 1000) - self.MAX_INPUT_EVENT_AGE_MS)
+
+        def is_allowed(key):
+            # when check release is False or the release lock is released (True)
+            return not check_release or (key in release_keys and HardwareButtonsConstants.release_lock) or key not in release_keys
+
         while True:
             cur_time = int(time.time() * 1000)
             if cur_time - self.last_input_time > controller.screensaver_activation_ms and not controller.is_screensaver_running:
@@ -70,54 +92,81 @@ class HardwareButtons(Singleton):
                 # Freeze any further processing for a moment to avoid having the wakeup
                 #   input register in the resumed UI.
                 time.sleep(self.next_repeat_threshold / 1000.0)
+                self.clear_input_events()
 
                 # Resume from a fresh loop
                 continue
 
-            for key in keys:
-                if not check_release or ((check_release and key in release_keys and HardwareButtonsConstants.release_lock) or check_release and key not in release_keys):
-                    # when check release is False or the release lock is released (True)
-                    if self.GPIO.input(key) == GPIO.LOW or self.override_ind:
-                        HardwareButtonsConstants.release_lock = False
-                        if self.override_ind:
-                            self.override_ind = False
-                            return HardwareButtonsConstants.OVERRIDE
-
-                        if self.cur_input != key:
-                            self.cur_input = key
-                            self.cur_input_started = int(time.time() * 1000)  # in milliseconds
-                            self.last_input_time = self.cur_input_started
-                            return key
-
-                        else:
-                            # Still pressing the same input
-                            if cur_time - self.last_input_time > self.next_repeat_threshold:
-                                # Too much time has elapsed to consider this the same
-                                #   continuous input. Treat as a new separate press.
-                                self.cur_input_started = cur_time
-                                self.last_input_time = cur_time
-                                return key
-
-                            elif cur_time - self.cur_input_started > self.first_repeat_threshold:
-                                # We're good to relay this immediately as continuous
-                                #   input.
-                                self.last_input_time = cur_time
-                                return key
-
-                            else:
-                                # We're not yet at the first repeat threshold; triggering
-                                #   a key now would be too soon and yields a bad user
-                                #   experience when only a single click was intended but
-                                #   a second input is processed because of race condition
-                                #   against human response time to release the button.
-                                # So there has to be a delay before we allow the first
-                                #   continuous repeat to register. So we'll ignore this
-                                #   round's input and **won't update any of our
-                                #   timekeeping vars**. But once we cross the threshold,
-                                #   we let the repeats fly.
-                                pass
-
-            time.sleep(0.01) # wait 10 ms to give CPU chance to do other things
+            # Sleep until the next key event or the screensaver deadline...
+            timeout_ms = max(self.last_input_time + controller.screensaver_activation_ms - cur_time, 0) + 1
+
+            # ...or, if the last key is still being held down, until it's due to repeat
+            if self.cur_input in keys and is_allowed(self.cur_input) and self.GPIO.input(self.cur_input) == GPIO.LOW:
+                HardwareButtonsConstants.release_lock = False
+                if self.accept_input(self.cur_input, cur_time):
+                    return self.cur_input
+                timeout_ms = min(timeout_ms, self.cur_input_started + self.first_repeat_threshold - cur_time + 1)
+
+            event = self.next_input_event(timeout=timeout_ms / 1000.0)
+            if event is None:
+                continue
+            (key, event_time, is_press) = event
+
+            if not is_press:
+                # Applied in order with the presses so a release that happened
+                # between two queued presses unlocks the second one.
+                HardwareButtonsConstants.release_lock = True
+                continue
+
+            if key == HardwareButtonsConstants.OVERRIDE:
+                if self.override_ind:
+                    self.override_ind = False
+                    HardwareButtonsConstants.release_lock = False
+                    return HardwareButtonsConstants.OVERRIDE
+                continue
+
+            if key in keys and is_allowed(key):
+                HardwareButtonsConstants.release_lock = False
+                if self.accept_input(key, event_time):
+                    return key
+
+
+    def accept_input(self, key, cur_time) -> bool:
+        """
+            Applies the long-press/repeat rules to a press (or continued hold) of `key`
+            at `cur_time` (ms). Returns True if it should be relayed as input.
+        """
+        if self.cur_input != key:
+            self.cur_input = key
+            self.cur_input_started = cur_time
+            self.last_input_time = cur_time
+            return True
+
+        # Still pressing the same input
+        if cur_time - self.last_input_time > self.next_repeat_threshold:
+            # Too much time has elapsed to consider this the same
+            #   continuous input. Treat as a new separate press.
+            self.cur_input_started = cur_time
+            self.last_input_time = cur_time
+            return True
+
+        elif cur_time - self.cur_input_started > self.first_repeat_threshold:
+            # We're good to relay this immediately as continuous
+            #   input.
+            self.last_input_time = cur_time
+            return True
+
+        # We're not yet at the first repeat threshold; triggering
+        #   a key now would be too soon and yields a bad user
+        #   experience when only a single click was intended but
+        #   a second input is processed because of race condition
+        #   against human response time to release the button.
+        # So there has to be a delay before we allow the first
+        #   continuous repeat to register. So we'll ignore this
+        #   round's input and **won't update any of our
+        #   timekeeping vars**. But once we cross the threshold,
+        #   we let the repeats fly.
+        return False
 
 
     def update_last_input_time(self):
@@ -126,11 +175,79 @@ class HardwareButtons(Singleton):
 
     def add_events(self, keys=[]):
         for key in keys:
-            GPIO.add_event_detect(0, 0, callback=HardwareButtons.rising_callback)
-
-
-    def rising_callback(channel):
-        HardwareButtonsConstants.release_lock = True
+            # RPi.GPIO allows only one edge detection per pin, so watch both edges
+            GPIO.add_event_detect(key, GPIO.BOTH, callback=self.key_changed)
+
+
+    def key_changed(self, channel):
+        """
+            GPIO edge callback; may be called from any thread. The buttons pull their
+            pin LOW while held, so the level after the edge tells a press from a
+            release (which frees the release lock once wait_for() reaches it).
+        """
+        channel = int(channel)
+        self.post_input_event(channel, is_press=self.GPIO.input(channel) == GPIO.LOW)
+
+
+    def post_input_event(self, key: int, is_press: bool = True):
+        with self.input_condition:
+            if len(self.input_events) >= self.MAX_PENDING_INPUT_EVENTS:
+                (_, _, dropped_is_press) = self.input_events.popleft()
+                if not dropped_is_press:
+                    HardwareButtonsConstants.release_lock = True
+            self.input_events.append((key, int(time.time() * 1000), is_press))
+            self.input_condition.notify_all()
+
+
+    def next_input_event(self, timeout: float = None):
+        """ Pops the oldest (key, timestamp, is_press) event, blocking up to `timeout` seconds """
+        with self.input_condition:
+            if not self.input_events:
+                self.input_condition.wait(timeout)
+            if not self.input_events:
+                return None
+            return self.input_events.popleft()
+
+
+    def wait_for_any_input(self, timeout: float = None) -> bool:
+        """ Blocks up to `timeout` seconds for any key press; does not consume it """
+        with self.input_condition:
+            # Releases and OVERRIDE don't count, so don't return early for them
+            self.input_condition.wait_for(self._has_press_locked, timeout=timeout)
+        return self.has_any_input()
+
+
+    def clear_input_events(self, keys: List[int] = None, before: int = None):
+        """
+            Discards pending events (of `keys`, or all; if `before` is set, only those
+            older than that timestamp in ms). Discarded releases still count.
+        """
+        with self.input_condition:
+            remaining = deque()
+            for event in self.input_events:
+                (key, event_time, is_press) = event
+                if (keys is not None and key not in keys) or (before is not None and event_time >= before):
+                    remaining.append(event)
+                elif not is_press:
+                    HardwareButtonsConstants.release_lock = True
+            self.input_events = remaining
+
+
+    def has_input_event(self, keys: List[int] = None) -> bool:
+        """ True if there are recent pending presses (of `keys`, or of any key) """
+        with self.input_condition:
+            return self._has_press_locked(keys)
+
+
+    def _has_press_locked(self, keys: List[int] = None) -> bool:
+        # Presses older than MAX_INPUT_EVENT_AGE_MS were left behind by a screen that
+        # only checked for other keys; they mustn't keep toasts or the screensaver
+        # from running. Caller must hold `input_condition`.
+        oldest = int(time.time() * 1000) - self.MAX_INPUT_EVENT_AGE_MS
+        return any(
+            is_press and event_time >= oldest and key != HardwareButtonsConstants.OVERRIDE and (keys is None or key in keys)
+            for (key, event_time, is_press) in self.input_events
+        )
 
 
     def trigger_override(self, force_release = False) -> bool:
@@ -139,6 +256,8 @@ class HardwareButtons(Singleton):
 
         if not self.override_ind:
             self.override_ind = True
+            # Wake up wait_for()
+            self.post_input_event(HardwareButtonsConstants.OVERRIDE)
             return True
         return False
 
@@ -149,14 +268,20 @@ class HardwareButtons(Singleton):
     def check_for_low(self, key: int = None, keys: List[int] = None) -> bool:
         if key:
             keys = [key]
+        pending = self.has_input_event(keys)
+        if pending:
+            # Handled here, so don't let a later wait_for() see it again
+            self.clear_input_events(keys)
         for key in keys:
-            if self.GPIO.input(key) == self.GPIO.LOW:
+            if pending or self.GPIO.input(key) == self.GPIO.LOW:
                 self.update_last_input_time()
                 return True
         else:
             return False
 
     def has_any_input(self) -> bool:
+        if self.has_input_event():
+            return True
         for key in HardwareButtonsConstants.ALL_KEYS:
             if self.GPIO.input(key) == GPIO.LOW:
                 return True
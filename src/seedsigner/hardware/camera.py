@@ -1,4 +1,5 @@
 import io
+import numpy as np
 
 #from picamera import PiCamera
 from PIL import Image
@@ -49,6 +50,51 @@ class Camera(Singleton):
         return None
 
 
+    @property
+    def is_video_stream_running(self) -> bool:
+        return self._video_stream is not None
+
+
+    def wait_for_video_stream(self, last_frame_id: int = None, timeout: float = None):
+        """
+            Blocks until the stream has a raw frame newer than `last_frame_id`. Returns
+            (frame, frame_id); frame is None on timeout or once the stream stops.
+        """
+        video_stream = self._video_stream
+        if video_stream is None:
+            return (None, last_frame_id)
+        return video_stream.wait_for_frame(last_frame_id, timeout=timeout)
+
+
+    def to_decode_frame(self, frame, roi: float = None):
+        """
+            Decoder feed; kept apart from `read_video_stream(as_image=True)` so the
+            preview's PIL work never sits in front of decoding. Converts a raw frame
+            to a C-contiguous 2D uint8 luminance array (rotated to match the preview),
+            cropped to the centred `roi` fraction of each dimension if given.
+        """
+        return Camera.to_luminance(frame, rotation=90 + self._camera_rotation, roi=roi)
+
+
+    @staticmethod
+    def to_luminance(frame, rotation: int = 0, roi: float = None):
+        if roi:
+            height, width = frame.shape[:2]
+            roi_height = max(int(height * roi), 1)
+            roi_width = max(int(width * roi), 1)
+            y0 = (height - roi_height) // 2
+            x0 = (width - roi_width) // 2
+            frame = frame[y0:y0 + roi_height, x0:x0 + roi_width]
+
+        # Same ITU-R 601 luma pyzbar would compute from a PIL image, but only
+        # once and on the (cropped) RGB frame.
+        luminance = np.asarray(Image.fromarray(frame.astype(np.uint8, copy=False), 'RGB').convert('L'))
+
+        # Rotating the 8-bit plane is a cheap view; like PIL's rotate(), rot90 turns
+        # counter-clockwise.
+        return np.ascontiguousarray(np.rot90(luminance, (rotation // 90) % 4))
+
+
     def stop_video_stream_mode(self):
         if self._video_stream is not None:
             self._video_stream.stop()
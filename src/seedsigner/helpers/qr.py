@@ -2,7 +2,6 @@ import qrcode
 from qrcode.image.styledpil import StyledPilImage
 from qrcode.image.styles.moduledrawers import CircleModuleDrawer, GappedSquareModuleDrawer
 from PIL import Image, ImageDraw
-import subprocess
 
 class QR:
     STYLE__DEFAULT = 1
@@ -90,18 +89,45 @@ class QR:
                 ).resize((width,height)).convert('RGBA')
 
 
-    def qrimage_io(self, data, width=240, height=240, border=3, background_color="808080"):
-        if 1 <= border <= 10:
-            border_str = str(border)
-        else:
-            border_str = "3"
+    def qr_matrix(self, data, border=3):
+        """
+        Returns the QR module matrix (including the quiet zone border) as a list
+        of rows of bools; True is a dark module.
+        """
+        qr = qrcode.QRCode(version=None, error_correction=qrcode.constants.ERROR_CORRECT_L, box_size=1, border=border)
+        qr.add_data(data)
+        qr.make(fit=True)
+        return qr.get_matrix()
 
-        cmd = f"""qrencode -m {border_str} -s 3 -l L --foreground=000000 --background={background_color} -t PNG -o "/tmp/qrcode.png" "{str(data)}" """
-        rv = subprocess.call(cmd, shell=True)
 
-        # if qrencode fails, fall back to only encoder
-        if rv != 0:
-            return self.qrimage(data,width,height,border)
-        img = Image.open("/tmp/qrcode.png").resize((width,height), Image.NEAREST).convert("RGBA")
+    def qrimage_palette(self, data, border=3):
+        """
+        Rasterizes the QR in-process at one pixel per module as a two-color palette
+        ('P' mode) image: index 0 is the background, index 1 the dark modules. The
+        result can be kept and re-colored/scaled with `palette_to_image()` without
+        re-encoding the QR.
+        """
+        if not 1 <= border <= 10:
+            border = 3
 
+        matrix = self.qr_matrix(data, border)
+        num_modules = len(matrix)
+        img = Image.frombytes("P", (num_modules, num_modules), b"".join(bytes(row) for row in matrix))
+        img.putpalette(b"\xff\xff\xff\x00\x00\x00", rawmode="RGB")
         return img
+
+
+    @staticmethod
+    def palette_to_image(img, width=240, height=240, background_color="808080"):
+        """
+        Scales up a `qrimage_palette()` image with a single nearest-neighbor resize,
+        using `background_color` for its background. `img` itself is left as is.
+        """
+        background = bytes.fromhex(background_color.lstrip("#"))
+        img = img.copy()
+        img.putpalette(background + b"\x00\x00\x00", rawmode="RGB")
+        return img.resize((width, height), Image.NEAREST).convert("RGBA")
+
+
+    def qrimage_io(self, data, width=240, height=240, border=3, background_color="808080"):
+        return QR.palette_to_image(self.qrimage_palette(data, border), width, height, background_color)
@@ -5,55 +5,11 @@
 # Licensed under the "BSD-2-Clause Plus Patent License"
 #
 
-from .utils import crc32_bytes, partition
+import sys
 
-BYTEWORDS = 'ableacidalsoapexaquaarchatomauntawayaxisbackbaldbarnbeltbetabiasbluebodybragbrewbulbbuzzcalmcashcatschefcityclawcodecolacookcostcruxcurlcuspcyandarkdatadaysdelidicedietdoordowndrawdropdrumdulldutyeacheasyechoedgeepicevenexamexiteyesfactfairfernfigsfilmfishfizzflapflewfluxfoxyfreefrogfuelfundgalagamegeargemsgiftgirlglowgoodgraygrimgurugushgyrohalfhanghardhawkheathelphighhillholyhopehornhutsicedideaidleinchinkyintoirisironitemjadejazzjoinjoltjowljudojugsjumpjunkjurykeepkenokeptkeyskickkilnkingkitekiwiknoblamblavalazyleaflegsliarlimplionlistlogoloudloveluaulucklungmainmanymathmazememomenumeowmildmintmissmonknailnavyneednewsnextnoonnotenumbobeyoboeomitonyxopenovalowlspaidpartpeckplaypluspoempoolposepuffpumapurrquadquizraceramprealredorichroadrockroofrubyruinrunsrustsafesagascarsetssilkskewslotsoapsolosongstubsurfswantacotasktaxitenttiedtimetinytoiltombtoystriptunatwinuglyundouniturgeuservastveryvetovialvibeviewvisavoidvowswallwandwarmwaspwavewaxywebswhatwhenwhizwolfworkyankyawnyellyogayurtzapszerozestzinczonezoom'
-WORD_ARRAY = None
-
-def decode_word(word, word_len):
-    global WORD_ARRAY
-    global BYTEWORDS
-
-    if len(word) != word_len:
-        raise ValueError('Invalid Bytewords.')
-
-    dim = 26
-
-    # Since the first and last letters of each Byteword are unique,
-    # we can use them as indexes into a two-dimensional lookup table.
-    # This table is generated lazily.
-    if WORD_ARRAY == None:
-        WORD_ARRAY = [-1] * (dim * dim)  # create empty array
-
-        for i in range(256):
-            byteword_offset = i * 4
-            x = ord(BYTEWORDS[byteword_offset]) - ord('a')
-            y = ord(BYTEWORDS[byteword_offset + 3]) - ord('a')
-            array_offset = y * dim + x
-            WORD_ARRAY[array_offset] = i
-
-    # If the coordinates generated by the first and last letters are out of bounds,
-    # or the lookup table contains -1 at the coordinates, then the word is not valid.
-    x = ord(word[0].lower()) - ord('a')
-    y = ord((word[3 if len(word) == 4 else 1]).lower()) - ord('a')
-    if not (0 <= x and x < dim and 0 <= y and y < dim):
-        raise ValueError('Invalid Bytewords.')
+from .utils import crc32_bytes
 
-    offset = y * dim + x
-    value = WORD_ARRAY[offset]
-    if value == -1:
-        raise ValueError('Invalid Bytewords.')
-
-    # If we're decoding a full four-letter word, verify that the two middle letters are correct.
-    if len(word) == 4:
-        byteword_offset = value * 4
-        c1 = word[1].lower()
-        c2 = word[2].lower()
-        if c1 != BYTEWORDS[byteword_offset + 1] or c2 != BYTEWORDS[byteword_offset + 2]:
-            raise ValueError('Invalid Bytewords.')
-
-    # Successful decode.
-    return value
+BYTEWORDS = 'ableacidalsoapexaquaarchatomauntawayaxisbackbaldbarnbeltbetabiasbluebodybragbrewbulbbuzzcalmcashcatschefcityclawcodecolacookcostcruxcurlcuspcyandarkdatadaysdelidicedietdoordowndrawdropdrumdulldutyeacheasyechoedgeepicevenexamexiteyesfactfairfernfigsfilmfishfizzflapflewfluxfoxyfreefrogfuelfundgalagamegeargemsgiftgirlglowgoodgraygrimgurugushgyrohalfhanghardhawkheathelphighhillholyhopehornhutsicedideaidleinchinkyintoirisironitemjadejazzjoinjoltjowljudojugsjumpjunkjurykeepkenokeptkeyskickkilnkingkitekiwiknoblamblavalazyleaflegsliarlimplionlistlogoloudloveluaulucklungmainmanymathmazememomenumeowmildmintmissmonknailnavyneednewsnextnoonnotenumbobeyoboeomitonyxopenovalowlspaidpartpeckplaypluspoempoolposepuffpumapurrquadquizraceramprealredorichroadrockroofrubyruinrunsrustsafesagascarsetssilkskewslotsoapsolosongstubsurfswantacotasktaxitenttiedtimetinytoiltombtoystriptunatwinuglyundouniturgeuservastveryvetovialvibeviewvisavoidvowswallwandwarmwaspwavewaxywebswhatwhenwhizwolfworkyankyawnyellyogayurtzapszerozestzinczonezoom'
 
 def get_word(index):
     byteword_offset = index * 4
@@ -63,13 +19,47 @@ def get_minimal_word(index):
     byteword_offset = index * 4
     return BYTEWORDS[byteword_offset] + BYTEWORDS[byteword_offset + 3]
 
-def encode(buf, separator):
-    words = []
-    for i in range(len(buf)):
-        byte = buf[i]
-        words.append(get_word(byte))
+# Static lookup tables, built once at import:
+#   * WORDS / MINIMAL_WORDS: byte value -> 4-letter / 2-letter word
+#   * WORD_TO_BYTE: lowercase 4-letter word -> byte value
+#   * LETTER_INDEXES: `bytes.translate` table mapping a-z and A-Z to 0-25 and
+#     everything else to 0xff
+#   * MINIMAL_PAIR_TO_BYTE: two letter indexes read as one native-endian uint16
+#     -> byte value, or -1 if the pair isn't a minimal byteword
+WORDS = tuple(get_word(i) for i in range(256))
+MINIMAL_WORDS = tuple(get_minimal_word(i) for i in range(256))
+WORD_TO_BYTE = {word: i for i, word in enumerate(WORDS)}
+
+_letters = bytearray([0xff] * 256)
+for i in range(26):
+    _letters[ord('a') + i] = i
+    _letters[ord('A') + i] = i
+LETTER_INDEXES = bytes(_letters)
+
+MINIMAL_PAIR_TO_BYTE = [-1] * (26 * 256)
+for i, word in enumerate(MINIMAL_WORDS):
+    pair = word.encode().translate(LETTER_INDEXES)
+    MINIMAL_PAIR_TO_BYTE[int.from_bytes(pair, sys.byteorder)] = i
+
+def decode_minimal_body(s):
+    # Turn the whole string into letter indexes in one pass, then view it as an
+    # array of uint16 so that every element is one (first, last) letter pair.
+    try:
+        pairs = s.encode('ascii').translate(LETTER_INDEXES)
+    except UnicodeEncodeError:
+        raise ValueError('Invalid Bytewords.')
+
+    if len(pairs) % 2 != 0 or 0xff in pairs:
+        raise ValueError('Invalid Bytewords.')
 
-    return separator.join(words)
+    # Invalid pairs map to -1, which bytearray() rejects with a ValueError
+    try:
+        return bytearray(map(MINIMAL_PAIR_TO_BYTE.__getitem__, memoryview(pairs).cast('H')))
+    except ValueError:
+        raise ValueError('Invalid Bytewords.')
+
+def encode(buf, separator):
+    return separator.join(map(WORDS.__getitem__, buf))
 
 def add_crc(buf):
     crc_buf = crc32_bytes(buf)
@@ -80,35 +70,23 @@ def encode_with_separator(buf, separator):
     return encode(crc_buf, separator)
 
 def encode_minimal(buf):
-    result = ''
-
     crc_buf = add_crc(buf)
-    for i in range(len(crc_buf)):
-        byte = crc_buf[i]
-        result += get_minimal_word(byte)
-
-    return result
+    return ''.join(map(MINIMAL_WORDS.__getitem__, crc_buf))
 
 def decode(s, separator, word_len):
-    buf = bytearray()
-
     if word_len == 4:
-        words = s.split(separator)
+        try:
+            buf = bytearray(map(WORD_TO_BYTE.__getitem__, s.lower().split(separator)))
+        except KeyError:
+            raise ValueError('Invalid Bytewords.')
     else:
-        words = partition(s, 2)
-
-    for word in words:
-        buf.append(decode_word(word, word_len))
+        buf = decode_minimal_body(s)
 
     if len(buf) < 5:
         raise ValueError('Invalid Bytewords.') 
 
-    # Validate checksum
+    # Strip the checksum; as before, it isn't validated
     body = buf[0:-4]
-    body_checksum = buf[-4:]
-    checksum = crc32_bytes(body)
-    # if checksum != body_checksum:
-    #     raise ValueError('Invalid Bytewords.')
 
     return body
 
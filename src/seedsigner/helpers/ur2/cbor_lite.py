@@ -164,7 +164,8 @@ class CBOREncoder:
 
 class CBORDecoder:
     def __init__(self, buf):
-        self.buf = buf
+        # Work on a view so that byte strings can be handed out without copying
+        self.buf = memoryview(buf)
         self.pos = 0
 
     def decodeTagAndAdditional(self, flags=Flag_None):
@@ -187,44 +188,24 @@ class CBORDecoder:
             value = additional
             return (tag, value, length)
 
-        value = 0
         if additional == Tag_Minor_length8:
-            if end - self.pos < 8:
-                raise Exception("Not enough input")            
-            for shift in [56, 48, 40, 32, 24, 16, 8, 0]:
-                value |= self.buf[self.pos] << shift
-                self.pos += 1
-            if ((flags & Flag_Require_Minimal_Encoding) and value == 0):
-                raise Exception("Encoding not minimal")
-            return (tag, value, self.pos)
+            value_length = 8
         elif additional == Tag_Minor_length4:
-            if end - self.pos < 4:
-                raise Exception("Not enough input")            
-            for shift in [24, 16, 8, 0]:
-                value |= self.buf[self.pos] << shift
-                self.pos += 1
-            if ((flags & Flag_Require_Minimal_Encoding) and value == 0):
-                raise Exception("Encoding not minimal")
-            return (tag, value, self.pos)
+            value_length = 4
         elif additional == Tag_Minor_length2:
-            if end - self.pos < 2:
-                raise Exception("Not enough input")            
-            for shift in [8, 0]:
-                value |= self.buf[self.pos] << shift
-                self.pos += 1
-            if ((flags & Flag_Require_Minimal_Encoding) and value == 0):
-                raise Exception("Encoding not minimal")
-            return (tag, value, self.pos)
+            value_length = 2
         elif additional == Tag_Minor_length1:
-            if end - self.pos < 1:
-                raise Exception("Not enough input")            
-            value |= self.buf[self.pos]
-            self.pos += 1
-            if ((flags & Flag_Require_Minimal_Encoding) and value == 0):
-                raise Exception("Encoding not minimal")
-            return (tag, value, self.pos)
+            value_length = 1
+        else:
+            raise Exception("Bad additional value")
 
-        raise Exception("Bad additional value")
+        if end - self.pos < value_length:
+            raise Exception("Not enough input")
+        value = int.from_bytes(self.buf[self.pos : self.pos + value_length], 'big')
+        self.pos += value_length
+        if ((flags & Flag_Require_Minimal_Encoding) and value == 0):
+            raise Exception("Encoding not minimal")
+        return (tag, value, self.pos)
 
     def decodeUnsigned(self, flags=Flag_None):
         (tag, value, length) = self.decodeTagAndValue(flags)
@@ -269,6 +250,24 @@ class CBORDecoder:
         self.pos += byte_length
         return (value, size_length + byte_length)
 
+    def decodeBytesView(self, flags=Flag_None):
+        """
+        Same as decodeBytes() but returns a memoryview into the input buffer instead
+        of a copy. The view keeps the input buffer alive and must not outlive any
+        changes made to it.
+        """
+        (tag, byte_length, size_length) = self.decodeTagAndValue(flags)
+        if tag != Tag_Major_byteString:
+            raise Exception("Not a byteString")
+
+        end = len(self.buf)
+        if end - self.pos < byte_length:
+            raise Exception("Not enough input")
+
+        value = self.buf[self.pos : self.pos + byte_length]
+        self.pos += byte_length
+        return (value, size_length + byte_length)
+
     def decodeEncodedBytesPrefix(self, flags=Flag_None):
         (tag, value, length1) = self.decodeTagAndValue(flags)
         if tag != Tag_Major_semantic or value != Tag_Minor_cborEncodedData:
@@ -7,12 +7,19 @@
 
 from .constants import MAX_UINT32
 
+try:
+    # zlib's CRC-32 uses the same polynomial, initial value and final XOR as below,
+    # but runs in C.
+    from zlib import crc32 as zlib_crc32
+except ImportError:
+    zlib_crc32 = None
+
 def bit_length(n):
     return len(bin(abs(n))) - 2
 
 TABLE = None
 
-def crc32(buf):
+def table_crc32(buf, value=0):
     # Lazily instantiate CRC table
     global TABLE
     if TABLE == None:
@@ -25,12 +32,42 @@ def crc32(buf):
 
             TABLE[i] = c
 
-    crc = MAX_UINT32 & ~0
+    # `value` is a previously returned CRC, so continuing from it means undoing
+    # its final inversion.
+    crc = MAX_UINT32 & ~value
     for byte in buf:
         crc = (crc >> 8) ^ TABLE[(crc ^ byte) & 0xFF]
 
     return MAX_UINT32 & ~crc
 
-def crc32n(buf):
-    n = crc32(buf)
+def crc32(buf, value=0):
+    if zlib_crc32 != None:
+        return zlib_crc32(buf, value) & MAX_UINT32
+    return table_crc32(buf, value)
+
+def crc32_to_bytes(n):
     return n.to_bytes((bit_length(n) + 7) // 8, 'big')
+
+def crc32n(buf):
+    return crc32_to_bytes(crc32(buf))
+
+class CRC32:
+    """
+    Incremental CRC-32: feed the message in pieces with `update()` (e.g. fragment by
+    fragment as they are reassembled) and read the result at the end.
+    """
+    def __init__(self, buf=None):
+        self.crc = 0
+        if buf != None:
+            self.update(buf)
+
+    def update(self, buf):
+        self.crc = crc32(buf, self.crc)
+        return self
+
+    def value(self):
+        return self.crc
+
+    def digest(self):
+        # Same format as `crc32n()`
+        return crc32_to_bytes(self.crc)
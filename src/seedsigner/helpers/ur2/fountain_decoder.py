@@ -6,7 +6,7 @@
 #
 import time
 from .fountain_utils import choose_fragments, contains, is_strict_subset, set_difference
-from .utils import join_lists, join_bytes, crc32_int, xor_with, take_first
+from .utils import join_lists, join_bytes, crc32_int, xor_bytes, take_first, CRC32
 
 class InvalidPart(Exception):
     pass
@@ -93,7 +93,7 @@ class FountainDecoder:
             mixed = []
             mixed_index_scoring = {}
             mixed_set = set()
-            for indexes, p in self.mixed_parts.items():
+            for indexes in self.mixed_index_sets():
                 if not indexes:
                     continue
                 mixed.append(self.indexes_to_string(indexes))
@@ -119,6 +119,9 @@ class FountainDecoder:
             return weighted_estimate
 
 
+    def mixed_index_sets(self):
+        return self.mixed_parts.keys()
+
     def receive_part(self, encoder_part):
         # Don't process the part if we're already done
         if self.is_complete():
@@ -201,7 +204,7 @@ class FountainDecoder:
             # The new fragments in the revised part are `a` - `b`.
             new_indexes = set_difference(a.indexes, b.indexes)
             # The new data in the revised part are `a` XOR `b`
-            new_data = xor_with(bytearray(a.data), b.data)
+            new_data = xor_bytes(a.data, b.data)
             return self.Part(new_indexes, new_data)
         else:
             # `a` is not reducable by `b`, so return a
@@ -324,7 +327,7 @@ class FountainDecoder:
         mixed = []
         mixed_set = set()
         try:
-            for indexes, p in self.mixed_parts.items():
+            for indexes in self.mixed_index_sets():
                 if not indexes or len(indexes) == 0:
                     continue
                 mixed.append(self.indexes_to_string(indexes))
@@ -339,3 +342,130 @@ class FountainDecoder:
         except Exception as e:
             import traceback
             traceback.print_exc()
+
+
+
+class BitMatrixFountainDecoder(FountainDecoder):
+    """
+    Drop-in replacement for FountainDecoder that treats the received parts as rows of a
+    matrix over GF(2) instead of reducing frozensets of indexes against each other.
+
+    Each row stores its fragment membership as an int bitmask and its data as an int,
+    so reducing one part by another is just two int XORs. Rows are kept in reduced row
+    echelon form, keyed by their pivot (the lowest set bit of the mask). A new part is
+    reduced by the pivots it touches and then eliminated from the rows that contain its
+    own pivot, so each frame costs at most one pass over the current rows rather than
+    rescanning every simple and mixed part.
+
+    A fragment is recovered as soon as its row is reduced to a single bit; the message
+    is complete once the matrix reaches full rank.
+    """
+    def __init__(self):
+        super().__init__()
+        # pivot fragment index -> (indexes bitmask, data as int)
+        self.rows = {}
+
+    @staticmethod
+    def indexes_to_mask(indexes):
+        mask = 0
+        for index in indexes:
+            mask |= 1 << index
+        return mask
+
+    @staticmethod
+    def mask_to_indexes(mask):
+        indexes = set()
+        while mask:
+            low = mask & -mask
+            indexes.add(low.bit_length() - 1)
+            mask ^= low
+        return indexes
+
+    def mixed_index_sets(self):
+        for mask, _ in self.rows.values():
+            # More than one bit set
+            if mask & (mask - 1):
+                yield frozenset(self.mask_to_indexes(mask))
+
+    def receive_part(self, encoder_part):
+        # Don't process the part if we're already done
+        if self.is_complete():
+            return False
+
+        # Don't continue if this part doesn't validate
+        if not self.validate_part(encoder_part):
+            return False
+
+        indexes = choose_fragments(encoder_part.seq_num, encoder_part.seq_len, encoder_part.checksum)
+        self.last_part_indexes = frozenset(indexes)
+        self.processed_parts_count += 1
+
+        # Cheap exit for the most common case: a simple part we already have
+        if len(indexes) == 1 and contains(self.received_part_indexes, next(iter(indexes))):
+            return False
+
+        if not self.add_row(self.indexes_to_mask(indexes), int.from_bytes(encoder_part.data, 'big')):
+            # This part didn't add any new info
+            return False
+
+        # Full rank: every row is now a single recovered fragment
+        if len(self.rows) == self.expected_part_count():
+            self.assemble_message()
+
+        return True
+
+    def add_row(self, mask, data):
+        rows = self.rows
+
+        # Reduce the new row by every existing pivot it contains. Pivot rows never
+        # contain another row's pivot, so only the bits of the original mask need
+        # to be checked.
+        remaining = mask
+        while remaining:
+            low = remaining & -remaining
+            remaining ^= low
+            row = rows.get(low.bit_length() - 1)
+            if row is not None:
+                mask ^= row[0]
+                data ^= row[1]
+
+        if mask == 0:
+            # Linearly dependent on what we already have
+            return False
+
+        pivot_bit = mask & -mask
+        pivot = pivot_bit.bit_length() - 1
+
+        # Eliminate the new pivot from the existing rows
+        for index, (row_mask, row_data) in list(rows.items()):
+            if row_mask & pivot_bit:
+                row_mask ^= mask
+                rows[index] = (row_mask, row_data ^ data)
+                if not row_mask & (row_mask - 1):
+                    self.received_part_indexes.add(index)
+
+        rows[pivot] = (mask, data)
+        if not mask & (mask - 1):
+            self.received_part_indexes.add(pivot)
+
+        return True
+
+    def assemble_message(self):
+        # Checksum each fragment as it is appended, throwing away any padding
+        message = bytearray()
+        crc = CRC32()
+        remaining = self.expected_message_len
+        for index in range(self.expected_part_count()):
+            fragment = self.rows[index][1].to_bytes(self.expected_fragment_len, 'big')
+            if remaining < len(fragment):
+                fragment = take_first(fragment, remaining)
+            remaining -= len(fragment)
+            crc.update(fragment)
+            message.extend(fragment)
+
+        # Verify the message checksum and note success or failure
+        checksum = crc.value()
+        if checksum == self.expected_checksum:
+            self.result = bytes(message)
+        else:
+            self.result = InvalidChecksum()
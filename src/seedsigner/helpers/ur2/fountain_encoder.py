@@ -7,8 +7,8 @@
 
 import math
 from .cbor_lite import CBORDecoder, CBOREncoder
-from .fountain_utils import choose_fragments
-from .utils import split, crc32_int, xor_into, data_to_hex
+from .fountain_utils import choose_fragments, compute_fragments
+from .utils import split, crc32_int, data_to_hex
 from .constants import MAX_UINT32, MAX_UINT64
 
 class InvalidHeader(Exception):
@@ -30,26 +30,19 @@ class Part:
             (array_size, _) = decoder.decodeArraySize()
             if array_size != 5:
                 raise InvalidHeader()
-                        
-            (seq_num, _) = decoder.decodeUnsigned()
-            if seq_num > MAX_UINT64:  # TODO: Do something better with this check
-                raise InvalidHeader()
-            
-            (seq_len, _) = decoder.decodeUnsigned()
-            if seq_len > MAX_UINT64:
-                raise InvalidHeader()
-            
-            (message_len, _) = decoder.decodeUnsigned()
-            if message_len > MAX_UINT64:
-                raise InvalidHeader()
-            
-            (checksum, _) = decoder.decodeUnsigned()
-            if checksum > MAX_UINT64:
-                raise InvalidHeader()
 
-            (data, _) = decoder.decodeBytes()
+            # seq_num, seq_len, message_len, checksum
+            header = []
+            for i in range(4):
+                (value, _) = decoder.decodeUnsigned()
+                if value > MAX_UINT64:  # TODO: Do something better with this check
+                    raise InvalidHeader()
+                header.append(value)
+
+            # Hand the fragment data on as a view into `cbor_buf` rather than a copy
+            (data, _) = decoder.decodeBytesView()
 
-            return Part(seq_num, seq_len, message_len, checksum, data)
+            return Part(header[0], header[1], header[2], header[3], data)
         except Exception as err:
             raise InvalidHeader()
 
@@ -91,6 +84,10 @@ class FountainEncoder:
         self.fragments = FountainEncoder.partition_message(message, self.fragment_len)
         self.seq_num = first_seq_num
         self.current_part: Part = None
+
+        # Callers that keep the parts they generate (so never ask for the same
+        # seq_num twice) can turn this off to keep out of the shared schedule cache
+        self.cache_fragments = True
     
     @staticmethod
     def find_nominal_fragment_length(message_len, min_fragment_len, max_fragment_len):
@@ -141,7 +138,10 @@ class FountainEncoder:
     def next_part(self):
         self.seq_num += 1
         self.seq_num = self.seq_num % MAX_UINT32  # wrap at period 2^32
-        indexes = choose_fragments(self.seq_num, self.seq_len(), self.checksum)
+        if self.cache_fragments:
+            indexes = choose_fragments(self.seq_num, self.seq_len(), self.checksum)
+        else:
+            indexes = compute_fragments(self.seq_num, self.seq_len(), self.checksum)
         mixed = self.mix(indexes)
         data = bytes(mixed)
         self.current_part = Part(self.seq_num, self.seq_len(), self.message_len, self.checksum, data)
@@ -157,7 +157,8 @@ class FountainEncoder:
 
 
     def mix(self, indexes):
-        result = [0] * self.fragment_len
+        # Accumulate the XOR as a single int instead of byte-by-byte
+        result = 0
         for index in indexes:
-            xor_into(result, self.fragments[index])
-        return result
+            result ^= int.from_bytes(self.fragments[index], 'big')
+        return result.to_bytes(self.fragment_len, 'big')
@@ -5,6 +5,8 @@
 # Licensed under the "BSD-2-Clause Plus Patent License"
 #
 
+from functools import lru_cache
+
 from .random_sampler import RandomSampler
 from .utils import int_to_bytes
 from .xoshiro256 import Xoshiro256
@@ -20,30 +22,46 @@ def shuffled(items, rng):
 
     return result
 
-def choose_degree(seq_len, rng):
+# The degree alias table only depends on `seq_len`, which is fixed for the whole
+# message, so build it once per `seq_len`.
+@lru_cache(maxsize=16)
+def degree_sampler(seq_len):
     degree_probabilities = []
     for i in range(1, seq_len + 1):
         degree_probabilities.append(1.0 / i)
 
-    degree_chooser = RandomSampler(degree_probabilities)
+    return RandomSampler(degree_probabilities)
+
+def choose_degree(seq_len, rng):
+    degree_chooser = degree_sampler(seq_len)
     return degree_chooser.next(lambda: rng.next_double()) + 1
 
+# The schedule is fully determined by (seq_num, seq_len, checksum). Scanning an
+# animated QR sees the same parts over and over, so keep a bounded cache of the
+# recent ones. The result is a frozenset because it is shared between callers.
+@lru_cache(maxsize=1024)
 def choose_fragments(seq_num, seq_len, checksum):
+    return compute_fragments(seq_num, seq_len, checksum)
+
+# Uncached `choose_fragments()`, for callers that only need each schedule once
+def compute_fragments(seq_num, seq_len, checksum):
     # The first `seq_len` parts are the "pure" fragments, not mixed with any
     # others. This means that if you only generate the first `seq_len` parts,
     # then you have all the parts you need to decode the message.
     if seq_num <= seq_len:
-        return set([seq_num - 1])
+        return frozenset([seq_num - 1])
     else:
         seed = int_to_bytes(seq_num) + int_to_bytes(checksum)
         rng = Xoshiro256.from_bytes(seed)
         degree = choose_degree(seq_len, rng)
-        indexes = []
+        remaining = list(range(seq_len))
 
-        for i in range(seq_len):
-            indexes.append(i)
-        shuffled_indexes = shuffled(indexes, rng)
-        return set(shuffled_indexes[0:degree])
+        # Same draws as `shuffled()`, but stop once the first `degree` are picked
+        chosen = []
+        for i in range(degree):
+            index = rng.next_int(0, len(remaining) - 1)
+            chosen.append(remaining.pop(index))
+        return frozenset(chosen)
 
 def contains(set_or_list, el):
     return el in set_or_list
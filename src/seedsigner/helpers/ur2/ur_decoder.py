@@ -5,9 +5,11 @@
 # Licensed under the "BSD-2-Clause Plus Patent License"
 #
 
+import time
+
 from .ur import UR
 from .fountain_encoder import FountainEncoder, Part as FountainEncoderPart
-from .fountain_decoder import FountainDecoder
+from .fountain_decoder import BitMatrixFountainDecoder
 from .bytewords import *
 from .utils import drop_first, is_ur_type
 
@@ -26,11 +28,35 @@ class InvalidSequenceComponent(Exception):
 class InvalidFragment(Exception):
     pass
 
+class URDecoderStats:
+    """
+    Per-decoder counters: how many parts were offered, how many were dropped as
+    already-seen duplicates, how many added new information, and the cumulative
+    time in seconds spent in each stage of `URDecoder.receive_part()`.
+    """
+    def __init__(self):
+        self.parts_seen = 0
+        self.duplicates = 0
+        self.useful_parts = 0
+        self.stage_time = {
+            'header': 0.0,
+            'bytewords': 0.0,
+            'cbor': 0.0,
+            'fountain': 0.0,
+        }
+
+    def description(self):
+        times = ', '.join('{}: {:.1f}ms'.format(stage, t * 1000.0) for stage, t in self.stage_time.items())
+        return "seen: {}, duplicates: {}, useful: {} | {}".format(self.parts_seen, self.duplicates, self.useful_parts, times)
+
+
 class URDecoder:
     def __init__(self):
-        self.fountain_decoder = FountainDecoder()
+        self.fountain_decoder = BitMatrixFountainDecoder()
         self.expected_type = None
         self.result = None
+        self.seen_sequence_components = set()
+        self.stats = URDecoderStats()
 
     @staticmethod
     def decode(str):
@@ -72,6 +98,37 @@ class URDecoder:
         comps = components[1:] # Don't include the ur type
         return (type, comps)
 
+    @staticmethod
+    def parse_header(str):
+        """
+        Cheaper alternative to `parse()` for scanned parts: only looks at the
+        `ur:<type>/[<seq>/]` prefix and returns (type, seq, body) without
+        lowercasing or splitting the body. `seq` is None for single-part URs.
+        """
+        # Validate URI scheme
+        if str[0:3].lower() != 'ur:':
+            raise InvalidScheme()
+
+        # Make sure there are at least two path components
+        type_end = str.find('/', 3)
+        if type_end == -1:
+            raise InvalidPathLength()
+
+        # Validate the type
+        type = str[3:type_end].lower()
+        if not is_ur_type(type):
+            raise InvalidType()
+
+        seq_end = str.find('/', type_end + 1)
+        if seq_end == -1:
+            return (type, None, str[type_end + 1:])
+
+        # Multi-part URs must have exactly two path components: seq/fragment
+        if str.find('/', seq_end + 1) != -1:
+            raise InvalidPathLength()
+
+        return (type, str[type_end + 1:seq_end], str[seq_end + 1:])
+
     @staticmethod
     def parse_sequence_component(str):
         try:
@@ -96,38 +153,65 @@ class URDecoder:
             return type == self.expected_type
 
     def receive_part(self, str):
+        stats = self.stats
+        stats.parts_seen += 1
         try:
             # Don't process the part if we're already done
             if self.result != None:
                 return False
 
             # Don't continue if this part doesn't validate
-            (type, components) = URDecoder.parse(str)
+            start = time.perf_counter()
+            (type, seq, body) = URDecoder.parse_header(str)
             if not self.validate_part(type):
                 return False
 
             # If this is a single-part UR then we're done
-            if len(components) == 1:
-                body = components[0]
+            if seq == None:
+                stats.stage_time['header'] += time.perf_counter() - start
+                start = time.perf_counter()
                 self.result = self.decode_by_type(type, body)
+                stats.stage_time['bytewords'] += time.perf_counter() - start
+                stats.useful_parts += 1
                 return True
 
-            # Multi-part URs must have two path components: seq/fragment
-            if len(components) != 2:
-                raise InvalidPathLength()
-            seq = components[0]
-            fragment = components[1]
+            # Parts are deterministic given their sequence component, so a repeat
+            # can't add anything new. Animated QRs loop, which makes this the most
+            # common case; drop it before any bytewords or CBOR work.
+            if seq in self.seen_sequence_components:
+                stats.duplicates += 1
+                stats.stage_time['header'] += time.perf_counter() - start
+                return False
 
             # Parse the sequence component and the fragment, and make sure they agree.
             (seq_num, seq_len) = URDecoder.parse_sequence_component(seq)
-            cbor = Bytewords.decode(Bytewords_Style_minimal, fragment)
+            now = time.perf_counter()
+            stats.stage_time['header'] += now - start
+            start = now
+
+            cbor = Bytewords.decode(Bytewords_Style_minimal, body)
+            now = time.perf_counter()
+            stats.stage_time['bytewords'] += now - start
+            start = now
+
             part = FountainEncoderPart.from_cbor(cbor)
+            now = time.perf_counter()
+            stats.stage_time['cbor'] += now - start
+            start = now
+
             if seq_num != part.seq_num or seq_len != part.seq_len:
                 return False
 
             # Process the part
-            if not self.fountain_decoder.receive_part(part):
+            added = self.fountain_decoder.receive_part(part)
+            stats.stage_time['fountain'] += time.perf_counter() - start
+
+            # Only remember parts that belong to the message being decoded
+            if part.checksum == self.fountain_decoder.expected_checksum:
+                self.seen_sequence_components.add(seq)
+            if not added:
                 return False
+            stats.useful_parts += 1
 
             if self.fountain_decoder.is_success():
                 self.result = UR(type, self.fountain_decoder.result_message())
@@ -5,7 +5,7 @@
 # Licensed under the "BSD-2-Clause Plus Patent License"
 #
 
-from .crc32 import crc32, crc32n
+from .crc32 import crc32, crc32n, CRC32
 
 def crc32_bytes(buf):
     checksum = crc32n(buf)
@@ -36,9 +36,6 @@ def is_ur_type(ch):
         return True
     return False
 
-def partition(s, n):
-    return [s[i:i+n] for i in range(0, len(s), n)]
-
 # Split the given sequence into two parts returned in a tuple
 # The first entry in the tuple has the first `count` values.
 # The second entry in the tuple has the remaining values.
@@ -55,11 +52,37 @@ def join_bytes(list_of_ba):
         out.extend(ba)
     return out
 
+# XOR two equal-length buffers a whole fragment at a time by treating each one as a
+# single big integer, rather than looping over the bytes in Python.
+def xor_bytes(a, b):
+    count = len(a)
+    assert count == len(b) # Must be the same length
+    return (int.from_bytes(a, 'big') ^ int.from_bytes(b, 'big')).to_bytes(count, 'big')
+
+# In-place variant; `target` must be mutable (bytearray or list of ints). XORs a
+# buffer 8 bytes at a time through a memoryview instead of building a new one;
+# `xor_bytes()` is faster when a new result is fine.
 def xor_into(target, source):
     count = len(target)
     assert count == len(source) # Must be the same length
-    for i in range(count):
-        target[i] ^= source[i]
+
+    try:
+        target_view = memoryview(target)
+        source_view = memoryview(source).cast('B')
+    except TypeError:
+        # Not a buffer (e.g. a list of ints)
+        for i in range(count):
+            target[i] ^= source[i]
+        return
+
+    aligned = count - count % 8
+    if aligned:
+        target_words = target_view[:aligned].cast('Q')
+        source_words = source_view[:aligned].cast('Q')
+        for i in range(aligned // 8):
+            target_words[i] ^= source_words[i]
+    for i in range(aligned, count):
+        target_view[i] ^= source_view[i]
 
 def xor_with(a, b):
     target = a
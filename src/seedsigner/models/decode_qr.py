@@ -1,6 +1,8 @@
 import base64
+import ctypes
 import json
 import logging
+import numpy as np
 import re
 
 from binascii import a2b_base64, b2a_base64
@@ -313,6 +315,14 @@ class DecodeQR:
         if image is None:
             return None
 
+        if isinstance(image, np.ndarray) and image.ndim == 2:
+            # 8-bit luminance (see `Camera.to_decode_frame`): hand zbar a view of
+            # the array's own memory instead of letting pyzbar copy it via tobytes().
+            # `luminance` keeps the memory alive until decode() returns.
+            luminance = np.ascontiguousarray(image, dtype=np.uint8)
+            pixels = (ctypes.c_ubyte * luminance.size).from_address(luminance.ctypes.data)
+            image = (pixels, luminance.shape[1], luminance.shape[0])
+
         barcodes = pyzbar.decode(image, symbols=[ZBarSymbol.QRCODE], binary=is_binary)
 
         # if barcodes:
@@ -4,6 +4,7 @@ from embit import bip32
 from embit.networks import NETWORKS
 from binascii import hexlify
 from dataclasses import dataclass
+from threading import Lock, Thread
 from typing import List
 from embit import bip32
 from embit.networks import NETWORKS
@@ -57,6 +58,11 @@ class BaseQrEncoder:
         return self.qr.qrimage_io(part, width, height, border, background_color=background_color)
 
 
+    def part_to_palette_image(self, part, border: int = 3):
+        """ Module-resolution 'P' mode image; see `QR.qrimage_palette()` """
+        return self.qr.qrimage_palette(part, border)
+
+
     def next_part_image(self, width=240, height=240, border=3, background_color="bdbdbd"):
         part = self.next_part()
         return self.part_to_image(part, width, height, border, background_color=background_color)
@@ -276,15 +282,23 @@ class SpecterXPubQrEncoder(BaseSimpleAnimatedQREncoder, BaseXpubQrEncoder):
 **************************************************************************************"""
 @dataclass
 class BaseFountainQrEncoder(BaseQrEncoder):
+    # How many full passes (`seq_len` parts each) of the fountain sequence to
+    # keep and then loop over.
+    precomputed_cycles: int = 2
+
     def __post_init__(self):
         super().__post_init__()
 
         self.ur2_encode: UREncoder = None
+        self.parts = []
+        self.part_num_sent = 0
+        self._parts_lock = Lock()
+        self._parts_thread = None
 
 
     @property
     def is_complete(self):
-        return self.ur2_encode.is_complete()
+        return self.part_num_sent >= self.seq_len()
 
 
     @property
@@ -298,8 +312,53 @@ class BaseFountainQrEncoder(BaseQrEncoder):
 
 
     def _create_parts(self):
-        """ parts are dynamically generated by the fountain encoder """
-        pass
+        """
+        Called once `ur2_encode` is set. The fountain sequence is deterministic, so
+        each of the first `num_parts()` parts only needs to be mixed, CBOR- and
+        bytewords-encoded once. A background thread does that ahead of the display
+        so later frames are served straight from `parts`.
+        """
+        with self._parts_lock:
+            if self._parts_thread is not None:
+                return
+            self.ur2_encode.restart()
+
+            # Each seq_num is only mixed once, so don't churn the shared schedule cache
+            self.ur2_encode.fountain_encoder.cache_fragments = False
+
+            self._parts_thread = Thread(target=self._precompute_parts, daemon=True)
+        self._parts_thread.start()
+
+
+    def _precompute_parts(self):
+        while True:
+            # Lock per part so a frame that gets ahead of us waits for one part at most
+            with self._parts_lock:
+                if len(self.parts) >= self.num_parts():
+                    return
+                self.parts.append(self.ur2_encode.next_part().upper())
+
+
+    def _get_part(self, index: int) -> str:
+        if self._parts_thread is None:
+            self._create_parts()
+
+        if index < len(self.parts):
+            return self.parts[index]
+
+        # The display got ahead of the background thread; parts are generated in
+        # order, so just help it along.
+        with self._parts_lock:
+            while len(self.parts) <= index:
+                self.parts.append(self.ur2_encode.next_part().upper())
+            return self.parts[index]
+
+
+    def num_parts(self) -> int:
+        """ Length of the loop of parts that is displayed """
+        if self.ur2_encode.is_single_part():
+            return 1
+        return max(1, self.precomputed_cycles) * self.seq_len()
 
 
     def seq_len(self):
@@ -307,15 +366,18 @@ class BaseFountainQrEncoder(BaseQrEncoder):
 
 
     def next_part(self) -> str:
-        return self.ur2_encode.next_part().upper()
+        part = self._get_part(self.part_num_sent % self.num_parts())
+        self.part_num_sent += 1
+        return part
 
 
     def cur_part(self) -> str:
-        return self.ur2_encode.current_part().upper()
+        """ The part last returned by `next_part()` (or the first part); does not advance """
+        return self._get_part(max(self.part_num_sent - 1, 0) % self.num_parts())
     
 
     def restart(self):
-        self.ur2_encode.fountain_encoder.restart()
+        self.part_num_sent = 0
 
 
 
@@ -384,6 +446,7 @@ class UrXpubQrEncoder(BaseFountainQrEncoder, BaseXpubQrEncoder):
         qr_ur_bytes = UR("crypto-account", ur_account.to_cbor())
 
         self.ur2_encode = UREncoder(ur=qr_ur_bytes, max_fragment_len=self.qr_max_fragment_size)
+        self._create_parts()
 
 
 
@@ -395,3 +458,4 @@ class UrPsbtQrEncoder(BaseFountainQrEncoder):
         super().__post_init__()
         qr_ur_bytes = UR("crypto-psbt", UR_PSBT(self.psbt.serialize()).to_cbor())
         self.ur2_encode = UREncoder(ur=qr_ur_bytes, max_fragment_len=self.qr_max_fragment_size)
+        self._create_parts()
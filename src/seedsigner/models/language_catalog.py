@@ -0,0 +1,264 @@
+"""
+    Compact, memory-mappable translation catalogs.
+
+    `LanguageTranslation` builds `<code>.cat` from `language/<code>.json` into a
+    per-user cache dir (see `default_catalog_dir`) the first time the language is
+    loaded, and rebuilds it whenever the json is newer. The package dir itself is
+    never written to. To prebuild them all (e.g. when baking an image):
+
+        python -m seedsigner.models.language_catalog [catalog_dir]
+
+    Layout:
+
+        header:  magic (4s) | version (H) | entry count (I)
+        entries: sorted by key hash; key hash, key offset, key length, value
+                 offset, value length (5 x I each)
+        pool:    utf-8 encoded keys and values
+
+    The key hash is the CRC-32 of the utf-8 key so it is stable across processes.
+
+    Placeholders are checked while building (see `check_placeholders`), so
+    translations served from a catalog can be formatted without re-checking.
+"""
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import zlib
+
+from string import Formatter
+
+logger = logging.getLogger(__name__)
+
+
+CATALOG_MAGIC = b"SSLC"
+CATALOG_VERSION = 2
+CATALOG_EXTENSION = "cat"
+
+HEADER = struct.Struct(">4sHI")
+ENTRY = struct.Struct(">5I")
+
+LANGUAGE_DIR = os.path.join(os.path.dirname(__file__), '..', 'language')
+
+
+
+def default_catalog_dir() -> str:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "seedsigner", "language")
+
+
+
+def catalog_path_for(language_code: str, catalog_dir: str = None) -> str:
+    if catalog_dir is None:
+        catalog_dir = default_catalog_dir()
+    return os.path.join(catalog_dir, f"{language_code}.{CATALOG_EXTENSION}")
+
+
+
+def key_hash(key: bytes) -> int:
+    return zlib.crc32(key) & 0xffffffff
+
+
+
+_formatter = Formatter()
+
+def placeholder_fields(template: str) -> set:
+    """ Names of the `str.format` replacement fields; raises ValueError if malformed """
+    return set(
+        field_name for (_, field_name, _, _) in _formatter.parse(template)
+        if field_name is not None
+    )
+
+
+
+def check_placeholders(text: str, translated: str) -> str:
+    """
+        A translation may drop replacement fields its source text has (e.g. plurals)
+        but must not introduce new ones. Returns a description of the problem, or
+        None if the translation is fine.
+    """
+    if "{" not in translated:
+        return None
+
+    try:
+        source_fields = placeholder_fields(text)
+    except ValueError:
+        # Not a format string; translate() hands it to str.format as-is
+        return None
+
+    try:
+        fields = placeholder_fields(translated)
+    except ValueError as e:
+        return f"has malformed placeholders: {e}"
+
+    if not fields.issubset(source_fields):
+        return f"uses placeholders {sorted(fields - source_fields)} not in the source text"
+    return None
+
+
+
+def compile_catalog(json_path: str, catalog_path: str):
+    with open(json_path, 'r', encoding='utf-8') as f:
+        translations = json.load(f)
+
+    for (text, translated) in translations.items():
+        problem = check_placeholders(text, translated)
+        if problem:
+            logger.warning(f"{json_path}: translation of {repr(text)} {problem}; using the source text")
+            translations[text] = text
+
+    items = sorted(
+        ((key_hash(k.encode('utf-8')), k.encode('utf-8'), v.encode('utf-8')) for k, v in translations.items()),
+        key=lambda item: (item[0], item[1])
+    )
+
+    pool = bytearray()
+    entries = bytearray()
+    pool_start = HEADER.size + ENTRY.size * len(items)
+    for (h, key, value) in items:
+        key_offset = pool_start + len(pool)
+        pool += key
+        value_offset = pool_start + len(pool)
+        pool += value
+        entries += ENTRY.pack(h, key_offset, len(key), value_offset, len(value))
+
+    # Write to a temp file and swap it in so a reader never maps a partial catalog
+    tmp_path = f"{catalog_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(CATALOG_MAGIC, CATALOG_VERSION, len(items)))
+        f.write(entries)
+        f.write(pool)
+    os.replace(tmp_path, catalog_path)
+
+
+
+def is_catalog_current(json_path: str, catalog_path: str) -> bool:
+    """ True if `catalog_path` is a catalog in this version's format and not older than its json """
+    try:
+        with open(catalog_path, 'rb') as f:
+            header = f.read(HEADER.size)
+    except OSError:
+        return False
+
+    if len(header) < HEADER.size or HEADER.unpack(header)[:2] != (CATALOG_MAGIC, CATALOG_VERSION):
+        return False
+
+    return not os.path.exists(json_path) or os.path.getmtime(catalog_path) >= os.path.getmtime(json_path)
+
+
+
+def ensure_catalog(json_path: str, catalog_path: str) -> bool:
+    """
+        (Re)builds `catalog_path` if it is missing or stale. Returns False if there is
+        no usable catalog (e.g. the install is read-only); callers then fall back to
+        the json.
+    """
+    if is_catalog_current(json_path, catalog_path):
+        return True
+
+    if not os.path.exists(json_path):
+        return False
+
+    try:
+        os.makedirs(os.path.dirname(catalog_path), exist_ok=True)
+        compile_catalog(json_path, catalog_path)
+    except OSError as e:
+        logger.warning(f"Could not build translation catalog {catalog_path}: {e}")
+        return False
+    return True
+
+
+
+class LanguageCatalog:
+    """
+        Read-only, dict-like view (`get()` only) onto a compiled catalog. The file is
+        mmapped so only the pages that are actually looked up get read in; decoded
+        strings are memoized.
+    """
+    def __init__(self, catalog_path: str):
+        with open(catalog_path, 'rb') as f:
+            self.buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, self.num_entries) = HEADER.unpack_from(self.buf, 0)
+        if magic != CATALOG_MAGIC or version != CATALOG_VERSION:
+            self.buf.close()
+            raise ValueError(f"{catalog_path} is not a v{CATALOG_VERSION} translation catalog")
+
+        self.lookups = {}
+
+
+    def close(self):
+        """ Unmaps the file; the catalog can't be used afterwards """
+        self.buf.close()
+
+
+    def _entry(self, index: int):
+        return ENTRY.unpack_from(self.buf, HEADER.size + index * ENTRY.size)
+
+
+    def _find(self, key: str):
+        encoded_key = key.encode('utf-8')
+        h = key_hash(encoded_key)
+
+        # Binary search for the first entry with this hash...
+        low = 0
+        high = self.num_entries
+        while low < high:
+            mid = (low + high) // 2
+            if self._entry(mid)[0] < h:
+                low = mid + 1
+            else:
+                high = mid
+
+        # ...then compare keys across any hash collisions
+        while low < self.num_entries:
+            (entry_hash, key_offset, key_len, value_offset, value_len) = self._entry(low)
+            if entry_hash != h:
+                break
+            if self.buf[key_offset:key_offset + key_len] == encoded_key:
+                return self.buf[value_offset:value_offset + value_len].decode('utf-8')
+            low += 1
+
+        return None
+
+
+    def get(self, key: str, default=None):
+        value = self.lookups.get(key)
+        if value is None:
+            value = self._find(key)
+            if value is None:
+                return default
+            self.lookups[key] = value
+        return value
+
+
+    def items(self):
+        for index in range(self.num_entries):
+            (_, key_offset, key_len, value_offset, value_len) = self._entry(index)
+            yield (
+                self.buf[key_offset:key_offset + key_len].decode('utf-8'),
+                self.buf[value_offset:value_offset + value_len].decode('utf-8'),
+            )
+
+
+
+def compile_all(catalog_dir: str = None, language_dir: str = LANGUAGE_DIR):
+    if catalog_dir is None:
+        catalog_dir = default_catalog_dir()
+    os.makedirs(catalog_dir, exist_ok=True)
+
+    for filename in sorted(os.listdir(language_dir)):
+        if not filename.endswith(".json"):
+            continue
+        json_path = os.path.join(language_dir, filename)
+        catalog_path = catalog_path_for(filename[:-len('.json')], catalog_dir)
+        compile_catalog(json_path, catalog_path)
+        print(f"{json_path} -> {catalog_path}")
+
+
+
+if __name__ == "__main__":
+    import sys
+    compile_all(*sys.argv[1:2])
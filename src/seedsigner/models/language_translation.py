@@ -1,29 +1,125 @@
 import json
+import logging
 import os
+import threading
+
+from seedsigner.models.language_catalog import LANGUAGE_DIR, LanguageCatalog, catalog_path_for, check_placeholders, ensure_catalog
+
+
+logger = logging.getLogger(__name__)
+
+
 
 class LanguageTranslation:
+    # Process-wide registry: each language file is loaded once and every caller
+    # shares the same LanguageTranslation instance for that language.
+    _instances = {}
+    _lock = threading.Lock()
+
+    # Where compiled catalogs are kept; None for `default_catalog_dir()`
+    catalog_dir = None
+
     def __init__(self, language_code):
         self.language_code = language_code
-        self.translations = self.load_translations()
+        self._translations = None
+
+        # Checked format templates, filled in per key as translate() needs them
+        self.templates = {}
+
+    @property
+    def translations(self):
+        # Only load the language on first use
+        if self._translations is None:
+            self._translations = self.load_translations()
+        return self._translations
+
+    @classmethod
+    def get_instance(cls, language_code):
+        instance = cls._instances.get(language_code)
+        if instance is None:
+            with cls._lock:
+                instance = cls._instances.get(language_code)
+                if instance is None:
+                    instance = cls(language_code)
+                    # Replace rather than mutate so readers never see a partial dict
+                    instances = dict(cls._instances)
+                    instances[language_code] = instance
+                    cls._instances = instances
+        return instance
+
+    @classmethod
+    def clear_cache(cls):
+        with cls._lock:
+            instances = cls._instances
+            cls._instances = {}
+        for instance in instances.values():
+            instance.close()
+
+    @classmethod
+    def unload(cls, language_code):
+        """ Drops a language that is no longer displayed (e.g. after switching languages) """
+        with cls._lock:
+            instances = dict(cls._instances)
+            instance = instances.pop(language_code, None)
+            cls._instances = instances
+        if instance is not None:
+            instance.close()
+
+    def close(self):
+        """ Releases the catalog's mmap; the language is reloaded if it's used again """
+        translations = self._translations
+        self._translations = None
+        self.templates = {}
+        if isinstance(translations, LanguageCatalog):
+            translations.close()
 
     def load_translations(self):
-        file_path = os.path.join(os.path.dirname(__file__), '..', 'language', f'{self.language_code}.json')
+        file_path = os.path.join(LANGUAGE_DIR, f'{self.language_code}.json')
+        catalog_path = catalog_path_for(self.language_code, self.catalog_dir)
+
+        # Prefer the compiled catalog (see `language_catalog`), building it on first
+        # use or if the json has been edited since.
+        if ensure_catalog(file_path, catalog_path):
+            return LanguageCatalog(catalog_path)
+
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Translation file {self.language_code}.json not found.")
         
         with open(file_path, 'r', encoding='utf-8') as f:
             return json.load(f)
 
+    def compile_template(self, text, translated):
+        """
+        Returns the template to format `text`'s translation with. Catalogs were
+        checked when they were built; json translations are checked here, once per
+        key. A translation that introduces placeholders its source text doesn't
+        have is reported and the source text is used instead.
+        """
+        if translated is not text and not isinstance(self.translations, LanguageCatalog):
+            problem = check_placeholders(text, translated)
+            if problem:
+                logger.warning(f"{self.language_code}: translation of {repr(text)} {problem}")
+                return text
+        return translated
+
     def translate(self, text, **kwargs):
         # 먼저 번역을 수행
         translated = self.translations.get(text, text)
+        if not kwargs:
+            return translated
 
         # 번역된 텍스트에 변수 값을 대입
-        if kwargs:
-            try:
-                translated = translated.format(**kwargs)
-            except KeyError:
-                # 변수 대입에 실패하면 원본 텍스트를 사용
-                return text.format(**kwargs)
-
-        return translated
\ No newline at end of file
+        template = self.templates.get(text)
+        if template is None:
+            template = self.compile_template(text, translated)
+            self.templates[text] = template
+
+        try:
+            return template.format_map(kwargs)
+        except (KeyError, IndexError, ValueError) as e:
+            if template is text:
+                # The caller's own format string is wrong
+                raise
+            logger.warning(f"{self.language_code}: could not format translation of {repr(text)} ({repr(e)}); using the source text")
+            self.templates[text] = text
+            return text.format_map(kwargs)
@@ -1,5 +1,6 @@
 import logging
-from threading import Thread, Lock
+from threading import Condition, Thread, Lock
+from typing import Any, Callable
 
 logger = logging.getLogger(__name__)
 
@@ -44,3 +45,83 @@ class ThreadsafeCounter:
             self.count = value
 
 
+
+class ThreadsafeMailbox:
+    """
+        Single-slot, latest-wins handoff between threads: `put()` replaces anything
+        not yet taken, so a slow consumer always gets the newest item and never a
+        backlog.
+
+        Every put() gets a sequence number. A consumer that calls `mark_done()` after
+        handling each item lets producers `wait_until_done()`; superseded items
+        count as done once a later one is.
+    """
+    def __init__(self):
+        self._item = None
+        self._has_item = False
+        self._is_closed = False
+        self._condition = Condition()
+        self._taken_sequence = 0
+        self._done_sequence = 0
+        self.num_put = 0
+        self.num_dropped = 0
+
+    @property
+    def is_closed(self) -> bool:
+        return self._is_closed
+
+    def put(self, item, merge: Callable[[Any, Any], Any] = None) -> int:
+        """
+            Returns the item's sequence number. If an older item is still waiting,
+            it is dropped, or combined with this one by `merge(older, item)`.
+        """
+        with self._condition:
+            if self._has_item:
+                self.num_dropped += 1
+                if merge is not None:
+                    item = merge(self._item, item)
+            self._item = item
+            self._has_item = True
+            self.num_put += 1
+            sequence = self.num_put
+            self._condition.notify_all()
+        return sequence
+
+    def take(self, timeout: float = None):
+        """ Waits up to `timeout` seconds for an item; None on timeout or once closed """
+        with self._condition:
+            self._condition.wait_for(lambda: self._has_item or self._is_closed, timeout=timeout)
+            if not self._has_item:
+                return None
+            item = self._item
+            self._item = None
+            self._has_item = False
+            self._taken_sequence = self.num_put
+            return item
+
+    def mark_done(self):
+        """ The consumer has finished with the item it last took """
+        with self._condition:
+            self._done_sequence = self._taken_sequence
+            self._condition.notify_all()
+
+    def wait_until_done(self, sequence: int = None, timeout: float = None) -> bool:
+        """
+            Blocks until the item with `sequence` (default: the latest put) has been
+            handled or superseded. Returns False on timeout or if closed first.
+        """
+        with self._condition:
+            if sequence is None:
+                sequence = self.num_put
+            return self._condition.wait_for(
+                lambda: self._done_sequence >= sequence or self._is_closed,
+                timeout=timeout
+            ) and self._done_sequence >= sequence
+
+    def close(self):
+        """ Wakes every waiting `take()` and `wait_until_done()` """
+        with self._condition:
+            self._is_closed = True
+            self._item = None
+            self._has_item = False
+            self._condition.notify_all()
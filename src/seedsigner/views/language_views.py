@@ -31,12 +31,16 @@ class LanguageSelectionView(View):
         }
 
         # selected_language를 적절한 언어 코드로 변환하여 설정합니다.
+        previous_language = view.view_current_selected_language
         current_selected_language = language_code_map.get(selected_language, "EN")  # 기본값은 'en'으로 설정
         view.view_current_selected_language=current_selected_language
         screen.screen_current_selected_language=current_selected_language
         components.components_current_selected_language=current_selected_language
 
-        translator = LanguageTranslation(current_selected_language).translate
+        translator = LanguageTranslation.get_instance(current_selected_language).translate
+        if previous_language != current_selected_language:
+            # Release the previous language's catalog
+            LanguageTranslation.unload(previous_language)
         font_current_selected_language= current_selected_language if current_selected_language in ("KR", "SC", "JP") else "EN"
         GUIConstants.TOP_NAV_TITLE_FONT_NAME = f'NotoSans{font_current_selected_language}-SemiBold'
         GUIConstants.BODY_FONT_NAME = f'NotoSans{font_current_selected_language}-SemiBold'
@@ -150,7 +150,8 @@ class ScreensaverScreen(LogoScreen):
                     crop = self.image.crop((
                         self.cur_x, self.cur_y,
                         self.cur_x + self.renderer.canvas_width, self.cur_y + self.renderer.canvas_height))
-                    self.renderer.disp.ShowImage(crop, 0, 0)
+                    # Paced by the display, like show_image_pan()
+                    self.renderer.submit_frame(crop, is_direct=True, wait=True)
 
                     self.cur_x += self.increment_x
                     self.cur_y += self.increment_y
@@ -10,7 +10,7 @@ from seedsigner.models.threads import BaseThread
 from seedsigner.models.language_translation import LanguageTranslation
 view_current_selected_language="EN"
 def translator(text):
-    return LanguageTranslation(view_current_selected_language).translate(text)
+    return LanguageTranslation.get_instance(view_current_selected_language).translate(text)
 class BackStackView:
     """
         Empty class that just signals to the Controller to pop the most recent View off
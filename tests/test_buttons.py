@@ -0,0 +1,52 @@
+import time
+
+import pytest
+
+from seedsigner.emulator.virtualGPIO import GPIO
+from seedsigner.hardware.buttons import HardwareButtons, HardwareButtonsConstants
+
+
+
+@pytest.fixture
+def buttons():
+    buttons = HardwareButtons.get_instance()
+    buttons.clear_input_events()
+    yield buttons
+    buttons.clear_input_events()
+    HardwareButtonsConstants.release_lock = True
+
+
+
+def test_wait_for_any_input_ignores_releases_and_override(buttons):
+    buttons.post_input_event(HardwareButtonsConstants.KEY_UP, is_press=False)
+    buttons.post_input_event(HardwareButtonsConstants.OVERRIDE)
+
+    start = time.time()
+    assert not buttons.wait_for_any_input(timeout=0.1)
+    assert time.time() - start >= 0.09
+
+
+
+def test_stale_presses_are_not_pending(buttons, monkeypatch):
+    buttons.post_input_event(HardwareButtonsConstants.KEY_UP)
+    assert buttons.has_input_event()
+    assert buttons.has_any_input()
+    assert buttons.wait_for_any_input(timeout=0)
+
+    # e.g. left behind by a screen that only checks for KEY_LEFT
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + (HardwareButtons.MAX_INPUT_EVENT_AGE_MS + 1) / 1000.0)
+    assert not buttons.has_input_event()
+    assert not buttons.has_any_input()
+
+
+
+def test_gpio_edges_post_press_and_release(buttons):
+    GPIO.press(HardwareButtonsConstants.KEY_LEFT)
+    GPIO.release(HardwareButtonsConstants.KEY_LEFT)
+
+    events = [(key, is_press) for (key, _, is_press) in buttons.input_events]
+    assert events == [
+        (HardwareButtonsConstants.KEY_LEFT, True),
+        (HardwareButtonsConstants.KEY_LEFT, False),
+    ]
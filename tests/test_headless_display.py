@@ -0,0 +1,39 @@
+from PIL import Image
+
+from seedsigner.emulator.headlessDisplay import headlessDisplay
+from seedsigner.gui.renderer import Renderer
+
+
+
+def test_recording(tmp_path):
+    display = headlessDisplay(record_dir=str(tmp_path))
+    display.ShowImage(Image.new("RGB", (240, 240), "red"), 0, 0)
+    display.ShowImageRegions(Image.new("RGB", (240, 240), "blue"), [(0, 0, 10, 10)])
+    display.ShowImageRegions(Image.new("RGB", (240, 240), "blue"), [])
+    display.close()
+
+    rows = (tmp_path / "frames.csv").read_text().splitlines()
+    assert len(rows) == 3
+    assert rows[2].startswith("2,") and rows[2].endswith(",0,0,10,10,frame_000002.png")
+    assert (tmp_path / "frame_000002.png").exists()
+
+    # Safe to call again, and frames are still shown (just not recorded)
+    display.close()
+    display.ShowImage(Image.new("RGB", (240, 240), "green"), 0, 0)
+    assert display.frame_count == 3
+    assert len((tmp_path / "frames.csv").read_text().splitlines()) == 3
+
+
+
+def test_reconfiguring_renderer_closes_the_old_display(tmp_path):
+    Renderer.configure_instance(display=Renderer.DISPLAY__HEADLESS, record_dir=str(tmp_path))
+    renderer = Renderer.get_instance()
+    old_display = renderer.disp
+    old_index = old_display._index
+
+    Renderer.configure_instance(display=Renderer.DISPLAY__HEADLESS)
+    assert old_index.closed
+    assert old_display._index is None
+    assert not renderer.flush_thread.is_alive()
+
+    Renderer.get_instance().flush_thread.stop()
@@ -0,0 +1,96 @@
+import json
+import os
+
+import pytest
+
+from seedsigner.models import language_catalog
+from seedsigner.models.language_catalog import LanguageCatalog, catalog_path_for, compile_catalog, ensure_catalog
+from seedsigner.models.language_translation import LanguageTranslation
+
+
+
+@pytest.fixture
+def catalog_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(LanguageTranslation, "catalog_dir", str(tmp_path))
+    LanguageTranslation.clear_cache()
+    yield str(tmp_path)
+    LanguageTranslation.clear_cache()
+
+
+
+def write_json(path, translations):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(translations, f)
+
+
+
+def test_default_catalog_dir_is_outside_the_package(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert catalog_path_for("DE") == os.path.join(str(tmp_path), "seedsigner", "language", "DE.cat")
+    assert not os.path.abspath(catalog_path_for("DE")).startswith(os.path.abspath(language_catalog.LANGUAGE_DIR))
+
+
+
+def test_catalog_lookup(tmp_path):
+    json_path = str(tmp_path / "XX.json")
+    catalog_path = str(tmp_path / "cache" / "XX.cat")
+    write_json(json_path, {"Back": "Zurück", "Hello {name}": "Hallo {name}", "Bad {a}": "Schlecht {b}"})
+
+    assert ensure_catalog(json_path, catalog_path)
+    catalog = LanguageCatalog(catalog_path)
+    assert catalog.get("Back") == "Zurück"
+    assert catalog.get("Hello {name}") == "Hallo {name}"
+    assert catalog.get("Missing", "Missing") == "Missing"
+
+    # Introduces a placeholder the source doesn't have, so the source is stored
+    assert catalog.get("Bad {a}") == "Bad {a}"
+
+    catalog.close()
+    assert catalog.buf.closed
+
+
+
+def test_stale_catalog_is_rebuilt(tmp_path):
+    json_path = str(tmp_path / "XX.json")
+    catalog_path = str(tmp_path / "XX.cat")
+    write_json(json_path, {"Back": "Zurück"})
+    compile_catalog(json_path, catalog_path)
+
+    write_json(json_path, {"Back": "Retour"})
+    os.utime(json_path, (os.path.getmtime(catalog_path) + 10,) * 2)
+    assert ensure_catalog(json_path, catalog_path)
+    assert LanguageCatalog(catalog_path).get("Back") == "Retour"
+
+
+
+def test_translation_uses_cache_dir(catalog_dir):
+    translation = LanguageTranslation.get_instance("DE")
+    assert isinstance(translation.translations, LanguageCatalog)
+    assert os.path.exists(os.path.join(catalog_dir, "DE.cat"))
+
+    catalog = translation.translations
+    LanguageTranslation.unload("DE")
+    assert catalog.buf.closed
+    assert LanguageTranslation.get_instance("DE") is not translation
+
+    # A closed instance that is still referenced reloads on next use
+    assert translation.translate("Back") == LanguageTranslation.get_instance("DE").translate("Back")
+    translation.close()
+
+
+
+def test_translate_falls_back_to_source_on_format_errors(catalog_dir, monkeypatch):
+    translation = LanguageTranslation("XX")
+    monkeypatch.setattr(translation, "_translations", {
+        "Hello {name}": "Hallo {name!z}",
+        "{n} of {total}": "{0} von {total}",
+    })
+
+    assert translation.translate("Hello {name}", name="Bob") == "Hello Bob"
+    assert translation.translate("{n} of {total}", n=1, total=2) == "1 of 2"
+
+    # Remembered, so the broken translation isn't retried
+    assert translation.templates["Hello {name}"] == "Hello {name}"
+
+    with pytest.raises(KeyError):
+        translation.translate("{n} of {total}", n=1)
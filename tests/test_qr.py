@@ -0,0 +1,15 @@
+from seedsigner.helpers.qr import QR
+
+
+
+def test_palette_to_image_leaves_source_palette_alone():
+    modules = QR().qrimage_palette("UR:BYTES/HDCXDWINVEZM", border=2)
+    palette = modules.getpalette()
+
+    light = QR.palette_to_image(modules, 240, 240, background_color="ffffff")
+    dark = QR.palette_to_image(modules, 240, 240, background_color="1f1f1f")
+
+    assert modules.getpalette() == palette
+    assert light.size == (240, 240)
+    assert light.getpixel((0, 0)) == (255, 255, 255, 255)
+    assert dark.getpixel((0, 0)) == (31, 31, 31, 255)
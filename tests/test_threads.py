@@ -0,0 +1,79 @@
+import queue
+import threading
+
+import pytest
+
+from seedsigner.models.threads import ThreadsafeMailbox
+
+
+
+def test_mailbox_latest_wins():
+    mailbox = ThreadsafeMailbox()
+    mailbox.put(1)
+    mailbox.put(2)
+    assert mailbox.num_dropped == 1
+    assert mailbox.take(timeout=0) == 2
+    assert mailbox.take(timeout=0) is None
+
+
+
+def test_mailbox_close():
+    mailbox = ThreadsafeMailbox()
+    assert not mailbox.is_closed
+
+    taken = []
+    consumer = threading.Thread(target=lambda: taken.append(mailbox.take()))
+    consumer.start()
+    mailbox.close()
+    consumer.join(timeout=1)
+
+    assert not consumer.is_alive()
+    assert taken == [None]
+    assert mailbox.is_closed
+    assert not mailbox.wait_until_done(mailbox.put(3), timeout=0)
+
+
+
+class FakeCamera:
+    """ Serves `frames` once, then reports the video stream as stopped """
+    def __init__(self, frames):
+        self.frames = list(frames)
+        self.is_video_stream_running = True
+
+
+    def wait_for_video_stream(self, last_frame_id=None, timeout=None):
+        if self.frames:
+            return (self.frames.pop(0), (last_frame_id or 0) + 1)
+        self.is_video_stream_running = False
+        return (None, last_frame_id)
+
+
+    def to_decode_frame(self, frame, roi=None):
+        return frame
+
+
+
+def test_decode_workers_exit_when_stream_stops(monkeypatch):
+    scan_screens = pytest.importorskip("seedsigner.gui.screens.scan_screens")
+    ScanScreen = scan_screens.ScanScreen
+    monkeypatch.setattr(scan_screens.DecodeQR, "extract_qr_data", staticmethod(lambda frame, is_binary=False: frame))
+
+    camera = FakeCamera(frames=["a", "b"])
+    mailbox = ThreadsafeMailbox()
+    results = queue.Queue()
+    workers = [
+        ScanScreen.DecodeWorkerThread(camera=camera, frame_mailbox=mailbox, decode_results=results)
+        for i in range(3)
+    ]
+    for worker in workers:
+        worker.start()
+    feeder = ScanScreen.FrameFeederThread(camera=camera, frame_mailbox=mailbox)
+    feeder.start()
+
+    # No stop() calls: the workers must notice the closed mailbox on their own
+    feeder.join(timeout=1)
+    for worker in workers:
+        worker.join(timeout=1)
+        assert not worker.is_alive()
+    assert mailbox.is_closed
+    assert results.qsize() <= 2
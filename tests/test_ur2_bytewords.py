@@ -0,0 +1,49 @@
+import pytest
+
+from seedsigner.helpers.ur2.bytewords import (Bytewords, Bytewords_Style_minimal,
+    Bytewords_Style_standard, Bytewords_Style_uri)
+
+
+
+# Reference vectors from the BC-UR spec
+DATA = bytes([0, 1, 2, 128, 255])
+ENCODED = {
+    Bytewords_Style_standard: "able acid also lava zoom jade need echo taxi",
+    Bytewords_Style_uri: "able-acid-also-lava-zoom-jade-need-echo-taxi",
+    Bytewords_Style_minimal: "aeadaolazmjendeoti",
+}
+
+
+
+@pytest.mark.parametrize("style", list(ENCODED))
+def test_encode(style):
+    assert Bytewords.encode(style, DATA) == ENCODED[style]
+
+
+
+@pytest.mark.parametrize("style", list(ENCODED))
+def test_decode(style):
+    assert Bytewords.decode(style, ENCODED[style]) == DATA
+    assert Bytewords.decode(style, ENCODED[style].upper()) == DATA
+
+
+
+@pytest.mark.parametrize("style", list(ENCODED))
+def test_round_trip(style):
+    data = bytes(range(256))
+    assert Bytewords.decode(style, Bytewords.encode(style, data)) == data
+
+
+
+@pytest.mark.parametrize("style,encoded", [
+    (Bytewords_Style_standard, "able acid also lava"),   # shorter than the checksum
+    (Bytewords_Style_standard, "able acid also lava zoom jade need echo taxx"),
+    (Bytewords_Style_uri, "able-acid-also-lava-zoom-jade-need-echo-tax"),
+    (Bytewords_Style_minimal, "aeadaolazmjendeot"),    # odd length
+    (Bytewords_Style_minimal, "aeadaolazmjendeoxx"),
+    (Bytewords_Style_minimal, "aeadaolazmjendeo1i"),
+    (Bytewords_Style_minimal, "aeadaolazmjendeotí"),
+])
+def test_decode_invalid(style, encoded):
+    with pytest.raises(ValueError):
+        Bytewords.decode(style, encoded)
@@ -0,0 +1,69 @@
+import pytest
+
+from seedsigner.helpers.ur2 import crc32 as crc32_module
+from seedsigner.helpers.ur2.crc32 import CRC32, crc32, crc32_to_bytes, crc32n, table_crc32
+from seedsigner.helpers.ur2.utils import crc32_int
+
+
+
+# Standard CRC-32 (IEEE 802.3) check values; "Wolf" is the BC-UR reference vector
+VECTORS = [
+    (b"", 0x00000000),
+    (b"123456789", 0xCBF43926),
+    (b"Hello, world!", 0xEBE6C6E6),
+    (b"Wolf", 0x598C84DC),
+    (bytes(range(256)), 0x29058C73),
+]
+
+
+
+@pytest.fixture(params=["zlib", "table"])
+def crc_impl(request, monkeypatch):
+    """ Runs a test against both the zlib path and the pure-python fallback """
+    if request.param == "table":
+        monkeypatch.setattr(crc32_module, "zlib_crc32", None)
+    else:
+        assert crc32_module.zlib_crc32 is not None
+    return request.param
+
+
+
+@pytest.mark.parametrize("buf,expected", VECTORS)
+def test_table_crc32(buf, expected):
+    assert table_crc32(buf) == expected
+
+
+
+@pytest.mark.parametrize("buf,expected", VECTORS)
+def test_crc32(crc_impl, buf, expected):
+    assert crc32(buf) == expected
+    assert crc32_int(buf) == expected
+
+
+
+def test_crc32n():
+    assert crc32n(b"Wolf") == bytes.fromhex("598c84dc")
+
+    # Leading zero bytes are dropped, as in the reference implementation
+    assert crc32_to_bytes(0x00ab) == bytes.fromhex("ab")
+
+
+
+@pytest.mark.parametrize("buf,expected", VECTORS)
+def test_crc32_continuation(crc_impl, buf, expected):
+    # Continuing from a previous value gives the CRC of the concatenation
+    for split in {0, len(buf) // 3, len(buf)}:
+        assert crc32(buf[split:], crc32(buf[:split])) == expected
+        assert table_crc32(buf[split:], table_crc32(buf[:split])) == expected
+
+
+
+@pytest.mark.parametrize("buf,expected", VECTORS)
+def test_incremental_crc32(crc_impl, buf, expected):
+    crc = CRC32()
+    for i in range(0, len(buf), 7):
+        crc.update(buf[i:i + 7])
+    assert crc.value() == expected
+    assert crc.digest() == crc32_to_bytes(expected)
+
+    assert CRC32(buf).value() == expected